@@ -0,0 +1,50 @@
+"""Alembic 실행 환경 — 모델(metadata)과 DB 주소를 main.py에서 가져옴"""
+import os
+from logging.config import fileConfig
+
+from alembic import context
+
+# 마이그레이션이 스키마를 만들도록, main을 import할 때 create_all은 건너뜀
+os.environ["LEDGER_AUTO_CREATE_TABLES"] = "0"
+import main  # noqa: E402
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = main.Base.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """전문 검색 인덱스(FTS5 가상 테이블과 그림자 테이블, tsvector 칼럼)는 모델 밖 DDL로 관리 → 비교에서 제외"""
+    return not (name and (name in main.SEARCH_DB_OBJECTS or name.startswith("transactions_fts")))
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=main.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_name=include_name,
+        render_as_batch=main.DATABASE_URL.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    with main.engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            render_as_batch=connection.dialect.name == "sqlite",  # SQLite는 ALTER 대신 테이블 재생성
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,95 @@
+"""초기 스키마 (users/accounts/categories/transactions/budgets + 월별 롤업)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("role", sa.String(20), nullable=False),
+    )
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "accounts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("account_name", sa.String(50), nullable=False),
+        sa.Column("balance", sa.Numeric(14, 2), nullable=False),
+        sa.UniqueConstraint("user_id", "account_name", name="uq_user_accountname"),
+    )
+    op.create_index("ix_accounts_user_id", "accounts", ["user_id"])
+
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("type", sa.String(8), nullable=False),
+        sa.CheckConstraint("type in ('income','expense')", name="ck_category_type"),
+        sa.UniqueConstraint("user_id", "name", name="uq_user_categoryname"),
+    )
+    op.create_index("ix_categories_user_id", "categories", ["user_id"])
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("description", sa.String(255), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_transactions_account_id", "transactions", ["account_id"])
+    op.create_index("ix_transactions_category_id", "transactions", ["category_id"])
+    op.create_index("ix_transactions_date", "transactions", ["date"])
+    op.create_index("ix_tx_account_date_id", "transactions", ["account_id", "date", "id"])
+
+    op.create_table(
+        "budgets",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("month", sa.String(7), nullable=False),
+        sa.Column("amount", sa.Numeric(14, 2), nullable=False),
+        sa.UniqueConstraint("user_id", "category_id", "month", name="uq_budget_unique"),
+    )
+    op.create_index("ix_budgets_user_id", "budgets", ["user_id"])
+    op.create_index("ix_budgets_category_id", "budgets", ["category_id"])
+
+    op.create_table(
+        "monthly_category_totals",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("month", sa.String(7), nullable=False),
+        sa.Column("total", sa.Numeric(14, 2), nullable=False),
+        sa.Column("tx_count", sa.Integer(), nullable=False),
+        sa.UniqueConstraint("user_id", "month", "category_id", name="uq_rollup_unique"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_category_totals")
+    op.drop_table("budgets")
+    op.drop_table("transactions")
+    op.drop_table("categories")
+    op.drop_table("accounts")
+    op.drop_table("users")
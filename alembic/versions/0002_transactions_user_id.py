@@ -0,0 +1,42 @@
+"""transactions.user_id 비정규화 + 리포트/목록용 복합 인덱스
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+- user_id를 nullable로 추가 → accounts.user_id로 채움 → NOT NULL + FK
+- (user_id, date, category_id, amount): 사용자+기간 집계를 인덱스만으로
+- (user_id, date DESC, id DESC): 내 거래 목록/키셋 페이지네이션
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("user_id", sa.Integer(), nullable=True))
+
+    op.execute(
+        "UPDATE transactions SET user_id = "
+        "(SELECT accounts.user_id FROM accounts WHERE accounts.id = transactions.account_id)"
+    )
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.alter_column("user_id", existing_type=sa.Integer(), nullable=False)
+        batch.create_foreign_key("fk_transactions_user_id_users", "users", ["user_id"], ["id"], ondelete="CASCADE")
+
+    op.create_index("ix_tx_user_date_cat_amount", "transactions", ["user_id", "date", "category_id", "amount"])
+    op.create_index("ix_tx_user_date_id", "transactions", ["user_id", sa.text("date DESC"), sa.text("id DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tx_user_date_id", table_name="transactions")
+    op.drop_index("ix_tx_user_date_cat_amount", table_name="transactions")
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_constraint("fk_transactions_user_id_users", type_="foreignkey")
+        batch.drop_column("user_id")
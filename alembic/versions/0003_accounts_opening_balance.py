@@ -0,0 +1,36 @@
+"""accounts.opening_balance (잔액 정합성 검사 기준값)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+- 기존 계좌는 "현재 잔액 - 거래 합계"를 개설 잔액으로 채움 (지금 잔액이 맞다고 보고 시작)
+- 이후 /accounts/{id}/reconcile 이 opening_balance + 거래 합계와 저장된 잔액을 비교
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("accounts") as batch:
+        batch.add_column(sa.Column("opening_balance", sa.Numeric(14, 2), nullable=True))
+
+    op.execute(
+        "UPDATE accounts SET opening_balance = balance - COALESCE(("
+        "SELECT SUM(CASE WHEN categories.type = 'expense' THEN -transactions.amount ELSE transactions.amount END) "
+        "FROM transactions JOIN categories ON categories.id = transactions.category_id "
+        "WHERE transactions.account_id = accounts.id), 0)"
+    )
+
+    with op.batch_alter_table("accounts") as batch:
+        batch.alter_column("opening_balance", existing_type=sa.Numeric(14, 2), nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("accounts") as batch:
+        batch.drop_column("opening_balance")
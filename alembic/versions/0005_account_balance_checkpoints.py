@@ -0,0 +1,42 @@
+"""account_balance_checkpoints (계좌별 월말 누적 잔액 체크포인트)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+- (account_id, month)마다 개설 이후 그 달 말까지의 누적 순증감
+- 기존 거래로 백필: 월별 합계를 계좌별 누적합(SUM ... OVER)으로
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_balance_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("account_id", sa.Integer(), sa.ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("month", sa.String(7), nullable=False),
+        sa.Column("net_total", sa.Numeric(14, 2), nullable=False),
+        sa.UniqueConstraint("account_id", "month", name="uq_checkpoint_account_month"),
+    )
+
+    month = "strftime('%Y-%m', t.date)" if op.get_bind().dialect.name == "sqlite" else "to_char(t.date, 'YYYY-MM')"
+    op.execute(
+        "INSERT INTO account_balance_checkpoints (account_id, month, net_total) "
+        "SELECT account_id, month, SUM(net) OVER (PARTITION BY account_id ORDER BY month) FROM ("
+        f"  SELECT t.account_id AS account_id, {month} AS month, "
+        "   SUM(CASE WHEN c.type = 'expense' THEN -t.amount ELSE t.amount END) AS net "
+        "  FROM transactions t JOIN categories c ON c.id = t.category_id "
+        f"  GROUP BY t.account_id, {month}"
+        ") AS monthly"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_balance_checkpoints")
@@ -0,0 +1,52 @@
+"""거래 설명 전문 검색 인덱스 (SQLite FTS5 / PostgreSQL tsvector)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+- SQLite: 외부 콘텐츠 FTS5 테이블 transactions_fts + INSERT/DELETE/UPDATE 트리거, 기존 거래로 rebuild
+- PostgreSQL: 생성 칼럼 transactions.search_tsv (to_tsvector('simple', description)) + GIN 인덱스
+- 모델 밖 DB 객체라 alembic/env.py의 include_name이 autogenerate 비교에서 제외함
+- 주의: 이후 SQLite에서 transactions를 batch 모드로 재생성하는 마이그레이션은 트리거가 사라지므로 다시 만들어야 함
+"""
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5("
+    "description, content='transactions', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+    "INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')",
+]
+POSTGRES_DDL = [
+    "ALTER TABLE transactions ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(description, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_transactions_search_tsv ON transactions USING GIN (search_tsv)",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for ddl in SQLITE_DDL if dialect == "sqlite" else POSTGRES_DDL if dialect == "postgresql" else []:
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for trigger in ("transactions_fts_ai", "transactions_fts_ad", "transactions_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS transactions_fts")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_transactions_search_tsv")
+        op.execute("ALTER TABLE transactions DROP COLUMN IF EXISTS search_tsv")
@@ -0,0 +1,47 @@
+"""report_jobs (백그라운드 리포트/내보내기 작업)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+- 작업 상태/진행률/결과 크기와 보관 기한(expires_at), 결과 파일은 REPORT_JOB_DIR/<id>
+- 대기/실행 중인 같은 요청(dedup_key)은 하나만: 부분 유니크 인덱스 uq_report_jobs_inflight
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_jobs",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("params", sa.String(), nullable=False),
+        sa.Column("dedup_key", sa.String(64), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("progress", sa.Integer(), nullable=False),
+        sa.Column("error", sa.String(500), nullable=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_report_jobs_user_status", "report_jobs", ["user_id", "status"])
+    op.create_index("ix_report_jobs_expires_at", "report_jobs", ["expires_at"])
+    inflight = sa.text("status IN ('queued', 'running')")
+    op.create_index("uq_report_jobs_inflight", "report_jobs", ["dedup_key"], unique=True,
+                    sqlite_where=inflight, postgresql_where=inflight)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_report_jobs_inflight", table_name="report_jobs")
+    op.drop_index("ix_report_jobs_expires_at", table_name="report_jobs")
+    op.drop_index("ix_report_jobs_user_status", table_name="report_jobs")
+    op.drop_table("report_jobs")
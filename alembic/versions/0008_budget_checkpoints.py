@@ -0,0 +1,45 @@
+"""budget_checkpoints (카테고리별 월말 누적 예산/지출)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+- (category_id, month)마다 그 달까지의 예산 누적과 거래 합계 누적 — 누적 예산 현황(연간 누계/이월)용
+- 기존 예산과 거래로 백필: 월별 (예산, 지출)을 카테고리별 누적합(SUM ... OVER)으로
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "budget_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("month", sa.String(7), nullable=False),
+        sa.Column("cum_budget", sa.Numeric(14, 2), nullable=False),
+        sa.Column("cum_spent", sa.Numeric(14, 2), nullable=False),
+        sa.UniqueConstraint("category_id", "month", name="uq_budget_checkpoint_category_month"),
+    )
+
+    month = "strftime('%Y-%m', t.date)" if op.get_bind().dialect.name == "sqlite" else "to_char(t.date, 'YYYY-MM')"
+    op.execute(
+        "INSERT INTO budget_checkpoints (category_id, month, cum_budget, cum_spent) "
+        "SELECT category_id, month, SUM(budget) OVER (PARTITION BY category_id ORDER BY month), "
+        "       SUM(spent) OVER (PARTITION BY category_id ORDER BY month) FROM ("
+        "  SELECT category_id, month, SUM(budget) AS budget, SUM(spent) AS spent FROM ("
+        "    SELECT b.category_id AS category_id, b.month AS month, b.amount AS budget, 0 AS spent FROM budgets b"
+        "    UNION ALL"
+        f"   SELECT t.category_id, {month}, 0, t.amount FROM transactions t"
+        "  ) AS entries GROUP BY category_id, month"
+        ") AS monthly"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("budget_checkpoints")
@@ -0,0 +1,121 @@
+"""
+동기 모드 vs 비동기 모드(LEDGER_ASYNC_DB=1) 부하 테스트
+=====================================================
+실행: python benchmarks/bench_async.py --rows 20000 --concurrency 64 --duration 10
+
+- 모드마다 임시 폴더에서 uvicorn(main:app)을 띄우고 HTTP로 사용자/계좌/카테고리/거래를 시드합니다.
+- /transactions 와 /reports/summary 에 동시 요청을 duration초 동안 보내 requests/sec, p50/p99(ms)를 출력합니다.
+- 필요: pip install uvicorn httpx aiosqlite
+"""
+
+import argparse, asyncio, os, random, socket, statistics, subprocess, sys, tempfile, time
+from datetime import date, timedelta
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(workdir: str, port: int, env_extra: dict, workers: int = 1) -> subprocess.Popen:
+    env = dict(os.environ, **env_extra)
+    env.setdefault("RATE_LIMIT_ENABLED", "0")  # 부하 측정은 요청 한도 없이 (켜려면 RATE_LIMIT_ENABLED=1)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", ROOT, "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=workdir, env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("server did not start")
+
+
+def seed_over_http(base: str, rows: int, month: str) -> dict:
+    """HTTP로 시드: 회원가입 → 로그인 → 계좌/카테고리 → /transactions/bulk"""
+    c = httpx.Client(base_url=base, timeout=120)
+    c.post("/auth/register", json={"username": "bench", "email": "bench@example.com", "password": "benchpass"})
+    token = c.post("/auth/login", data={"username": "bench", "password": "benchpass"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    acc = c.post("/accounts", json={"account_name": "bench"}, headers=headers).json()
+    cats = [c.post("/categories", json={"name": f"c{i}", "type": "expense" if i < 8 else "income"}, headers=headers).json()
+            for i in range(10)]
+
+    rnd = random.Random(7)
+    y, m = int(month[:4]), int(month[5:7])
+    start = date(y, m, 1) - timedelta(days=365)
+    lines = ["account_id,category_id,amount,description,date"]
+    for _ in range(rows):
+        d = start + timedelta(days=rnd.randrange(395))
+        lines.append(f"{acc['id']},{rnd.choice(cats)['id']},{rnd.randint(100, 50000)},,{d.isoformat()}")
+    c.post("/transactions/bulk", files={"file": ("seed.csv", "\n".join(lines))}, headers=headers)
+    return headers
+
+
+async def hammer(base: str, path: str, headers: dict, concurrency: int, duration: float) -> dict:
+    latencies = []
+    errors = 0
+    stop_at = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(base_url=base, headers=headers, timeout=30,
+                                 limits=httpx.Limits(max_connections=concurrency)) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < stop_at:
+                t0 = time.perf_counter()
+                r = await client.get(path)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                if r.status_code != 200:
+                    errors += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 2) if len(latencies) > 1 else None,
+        "errors": errors,
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    month = date.today().strftime("%Y-%m")
+    paths = ["/transactions?limit=50", f"/reports/summary?month={month}"]
+    print(f"{'mode':<8}{'path':<36}{'rps':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for mode, env_extra in (("sync", {"LEDGER_ASYNC_DB": "0"}), ("async", {"LEDGER_ASYNC_DB": "1"})):
+        with tempfile.TemporaryDirectory() as workdir:
+            port = free_port()
+            proc = start_server(workdir, port, env_extra)
+            try:
+                base = f"http://127.0.0.1:{port}"
+                headers = seed_over_http(base, args.rows, month)
+                for path in paths:
+                    r = asyncio.run(hammer(base, path, headers, args.concurrency, args.duration))
+                    print(f"{mode:<8}{path:<36}{r['rps']:>10}{r['p50_ms']:>10}{r['p99_ms']:>10}{r['errors']:>8}")
+            finally:
+                proc.terminate()
+                proc.wait()
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,80 @@
+"""
+로그인 + CRUD 혼합 트래픽 벤치마크
+================================
+실행: python benchmarks/bench_auth.py --logins 16 --crud 32 --duration 10
+
+- uvicorn(main:app)을 띄우고, 로그인 작업자(bcrypt)와 CRUD 작업자(/accounts, /transactions)를 동시에 돌립니다.
+- 먼저 CRUD만 돌린 기준선을 재고, 이어서 로그인 폭주를 섞었을 때 CRUD 지연이 얼마나 늘어나는지 비교합니다.
+- 로그인 결과는 200 / 503(풀 포화) 개수로 나눠 출력합니다.
+- 환경변수 BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE 등은 서버에 그대로 전달됩니다.
+"""
+
+import argparse, asyncio, statistics, tempfile, time
+
+import httpx
+
+from bench_async import free_port, start_server, seed_over_http
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    if not latencies:
+        return {"n": 0, "p50_ms": None, "p99_ms": None}
+    return {
+        "n": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[max(int(len(latencies) * 0.99) - 1, 0)], 2),
+    }
+
+
+async def run_mix(base: str, headers: dict, logins: int, crud: int, duration: float) -> dict:
+    crud_lat, login_lat = [], []
+    login_status: dict = {}
+    stop_at = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(base_url=base, timeout=60, limits=httpx.Limits(max_connections=logins + crud)) as client:
+        async def crud_worker(i):
+            path = "/accounts" if i % 2 else "/transactions?limit=50"
+            while time.perf_counter() < stop_at:
+                t0 = time.perf_counter()
+                await client.get(path, headers=headers)
+                crud_lat.append((time.perf_counter() - t0) * 1000)
+
+        async def login_worker():
+            while time.perf_counter() < stop_at:
+                t0 = time.perf_counter()
+                r = await client.post("/auth/login", data={"username": "bench", "password": "benchpass"})
+                login_lat.append((time.perf_counter() - t0) * 1000)
+                login_status[r.status_code] = login_status.get(r.status_code, 0) + 1
+
+        await asyncio.gather(*(crud_worker(i) for i in range(crud)), *(login_worker() for _ in range(logins)))
+
+    return {"crud": summarize(crud_lat), "login": summarize(login_lat), "login_status": login_status}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--crud", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        port = free_port()
+        proc = start_server(workdir, port, {})
+        try:
+            base = f"http://127.0.0.1:{port}"
+            headers = seed_over_http(base, args.rows, time.strftime("%Y-%m"))
+            print(f"{'scenario':<16}{'crud n':>8}{'crud p50':>10}{'crud p99':>10}{'login n':>9}{'login p50':>11}  login status")
+            for name, logins in (("crud only", 0), ("crud + logins", args.logins)):
+                r = asyncio.run(run_mix(base, headers, logins, args.crud, args.duration))
+                print(f"{name:<16}{r['crud']['n']:>8}{str(r['crud']['p50_ms']):>10}{str(r['crud']['p99_ms']):>10}"
+                      f"{r['login']['n']:>9}{str(r['login']['p50_ms']):>11}  {r['login_status']}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,101 @@
+"""
+단건 API 반복 vs /transactions/batch 한 번 — 처리량 비교
+====================================================
+실행: python benchmarks/bench_batch.py --ops 500 [--async-db]
+
+- 임시 폴더에서 uvicorn(main:app)을 띄우고 계좌/카테고리와 기존 거래를 시드합니다.
+- 같은 모양의 작업 묶음(생성 60% / 수정 25% / 삭제 15%)을
+  before: POST/PATCH/DELETE /transactions 를 하나씩 순서대로
+  after : POST /transactions/batch 한 번 (mode=atomic, 작업마다 idempotency_key)
+  로 보내고 걸린 시간과 초당 작업 수를 출력합니다. 끝나면 reconcile drift가 0인지도 확인합니다.
+"""
+
+import argparse, random, sys, tempfile, time
+
+import httpx
+
+from bench_async import free_port, seed_over_http, start_server
+
+
+def make_ops(rnd: random.Random, n: int, acc_id: int, cat_ids: list, existing: list) -> list:
+    ops = []
+    pool = list(existing)
+    for i in range(n):
+        roll = rnd.random()
+        if roll < 0.25 and pool:
+            ops.append({"op": "update", "tx_id": rnd.choice(pool), "data": {"amount": str(rnd.randint(100, 50000))}})
+        elif roll < 0.40 and pool:
+            ops.append({"op": "delete", "tx_id": pool.pop(rnd.randrange(len(pool)))})
+        else:
+            ops.append({"op": "create", "data": {
+                "account_id": acc_id, "category_id": rnd.choice(cat_ids), "amount": str(rnd.randint(100, 50000)),
+                "description": f"offline {i}", "date": "2025-09-15",
+            }})
+    return ops
+
+
+def run_single(c: httpx.Client, ops: list) -> int:
+    failed = 0
+    for o in ops:
+        if o["op"] == "create":
+            r = c.post("/transactions", json=o["data"])
+        elif o["op"] == "update":
+            r = c.patch(f"/transactions/{o['tx_id']}", json=o["data"])
+        else:
+            r = c.delete(f"/transactions/{o['tx_id']}")
+        failed += r.status_code >= 300
+    return failed
+
+
+def run_batch(c: httpx.Client, ops: list) -> int:
+    keyed = [dict(o, idempotency_key=f"bench-{i}") for i, o in enumerate(ops)]
+    r = c.post("/transactions/batch", json={"mode": "atomic", "operations": keyed})
+    r.raise_for_status()
+    return r.json()["failed"]
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=5000, help="미리 시드할 거래 수")
+    parser.add_argument("--async-db", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        port = free_port()
+        proc = start_server(workdir, port, {"LEDGER_ASYNC_DB": "1" if args.async_db else "0"})
+        try:
+            base = f"http://127.0.0.1:{port}"
+            headers = seed_over_http(base, args.rows, time.strftime("%Y-%m"))
+            c = httpx.Client(base_url=base, headers=headers, timeout=120)
+            acc_id = c.get("/accounts").json()[0]["id"]
+            cat_ids = [x["id"] for x in c.get("/categories").json()]
+            existing, cursor = [], None
+            while len(existing) < 2 * args.ops:  # 키셋 페이지로 기존 거래 id 모으기
+                r = c.get("/transactions", params={"limit": 200, **({"cursor": cursor} if cursor else {})})
+                existing += [t["id"] for t in r.json()]
+                cursor = r.headers.get("x-next-cursor")
+                if not cursor:
+                    break
+            half = len(existing) // 2
+            rnd = random.Random(11)
+            single_ops = make_ops(rnd, args.ops, acc_id, cat_ids, existing[:half])
+            batch_ops = make_ops(rnd, args.ops, acc_id, cat_ids, existing[half:])
+
+            print(f"{'path':<28}{'ops':>6}{'seconds':>10}{'ops/sec':>12}{'failed':>8}")
+            for name, fn, ops in (("single calls", run_single, single_ops), ("POST /transactions/batch", run_batch, batch_ops)):
+                t0 = time.perf_counter()
+                failed = fn(c, ops)
+                dt = time.perf_counter() - t0
+                print(f"{name:<28}{len(ops):>6}{dt:>10.3f}{len(ops) / dt:>12.1f}{failed:>8}")
+
+            drift = c.post(f"/accounts/{acc_id}/reconcile").json()["drift"]
+            print(f"reconcile drift after run: {drift}")
+        finally:
+            proc.terminate()
+            proc.wait()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main_cli()
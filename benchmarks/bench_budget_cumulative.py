@@ -0,0 +1,89 @@
+"""
+누적 예산 현황 벤치마크 — 달마다 예산 현황을 부르기 vs 누적 체크포인트(prefix sum)
+================================================================================
+실행: python benchmarks/bench_budget_cumulative.py --users 5 --mean-tx 20000 --years 5 --repeat 50 [--out result.json]
+
+- synth.py로 가짜 장부(사용자마다 최근 --budget-months개월 예산)를 만들고, 가장 거래가 많은 사용자로 측정합니다.
+- before: 기간의 달마다 GET /reports/budget-status 를 불러 합치기 (연간 누계를 보려면 하던 방식)
+- after : GET /reports/budget-status/cumulative 한 번 (기간 1/12/60개월)
+- 두 방식의 카테고리별 예산/지출 합계가 같은지 확인합니다 (다르면 종료코드 1).
+"""
+
+import argparse, os, tempfile, time
+from decimal import Decimal
+
+from benchjson import ROOT, summarize, write_results
+from synth import generate, load_app
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--mean-tx", type=int, default=20_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--budget-months", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/budget-cumulative-<commit>.json)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LEDGER_ASYNC_DB", "0")
+    os.environ.setdefault("REPORT_CACHE_TTL_SECONDS", "0")  # before 경로가 캐시로 빨라지지 않게
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        ledger = generate(main, users=args.users, mean_tx=args.mean_tx, years=args.years,
+                          budget_months=args.budget_months, seed=args.seed)
+        heavy = ledger.users[0]
+        month = ledger.months[0]
+        print(f"seeded {ledger.transactions:,} transactions (heaviest user: {heavy.tx_count:,} tx), month={month}")
+
+        from fastapi.testclient import TestClient
+        results, mismatches = {}, 0
+        with TestClient(main.app) as c:
+            h = {"Authorization": "Bearer " + c.post(
+                "/auth/login", data={"username": heavy.username, "password": ledger.password}).json()["access_token"]}
+            print(f"{'case':<28}{'p50 ms':>10}{'p99 ms':>10}{'queries':>9}")
+            for span in (1, 12, 60):
+                since = main._add_months(month, -(span - 1))
+                months = [main._add_months(since, i) for i in range(span)]
+
+                def per_month():
+                    totals, queries = {}, 0
+                    for m in months:
+                        r = c.get("/reports/budget-status", params={"month": m}, headers=h)
+                        queries += int(r.headers["x-query-count"])
+                        for item in r.json():
+                            b, s = totals.get(item["category_id"], (Decimal(0), Decimal(0)))
+                            totals[item["category_id"]] = (b + Decimal(item["budget"]), s + Decimal(item["spent"]))
+                    return totals, queries
+
+                def cumulative():
+                    r = c.get("/reports/budget-status/cumulative", params={"month": month, "since": since}, headers=h)
+                    totals = {i["category_id"]: (Decimal(i["budget"]), Decimal(i["spent"])) for i in r.json()["items"]}
+                    return totals, int(r.headers["x-query-count"])
+
+                totals = {}
+                for name, fn in ((f"per_month_{span}m", per_month), (f"cumulative_{span}m", cumulative)):
+                    latencies, queries = [], []
+                    for _ in range(args.repeat if fn is cumulative else max(args.repeat // 5, 1)):
+                        t0 = time.perf_counter()
+                        totals[name], q = fn()
+                        latencies.append((time.perf_counter() - t0) * 1000)
+                        queries.append(q)
+                    results[name] = summarize(latencies, queries)
+                    print(f"{name:<28}{results[name]['p50_ms']:>10}{results[name]['p99_ms']:>10}"
+                          f"{results[name]['queries_per_request']:>9}")
+                if totals[f"per_month_{span}m"] != totals[f"cumulative_{span}m"]:
+                    mismatches += 1
+                    print(f"  MISMATCH span={span}: per-month={totals[f'per_month_{span}m']} "
+                          f"cumulative={totals[f'cumulative_{span}m']}")
+
+        params = dict(vars(args), transactions=ledger.transactions, heaviest_user_tx=heavy.tx_count, mismatches=mismatches)
+        os.chdir(ROOT)
+        print("saved", write_results("budget-cumulative", params, results, args.out))
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,91 @@
+"""
+핸들러별 마이크로 벤치마크 (프로세스 안, 네트워크 없음)
+====================================================
+실행: python benchmarks/bench_handlers.py --users 50 --mean-tx 2000 --repeat 50 [--out result.json]
+
+- synth.py로 가짜 장부를 만든 뒤, 가장 거래가 많은 사용자로 로그인해 핸들러를 하나씩 반복 호출합니다.
+  (TestClient로 라우팅/검증/직렬화까지 포함 — 실제 요청 한 번과 같은 경로)
+- list_transactions(첫 페이지 / 커서로 깊은 페이지 / 설명 검색), report_summary, report_budget_status, report_summary_csv
+  (리포트는 캐시 cold/warm 각각), login
+- 요청당 쿼리 수는 응답 헤더 X-Query-Count, 지연시간은 p50/p90/p99 — 결과는 JSON으로 저장되어
+  `python benchmarks/compare.py old.json new.json`으로 커밋 간 비교할 수 있습니다.
+"""
+
+import argparse, os, tempfile, time
+
+from benchjson import ROOT, summarize, write_results
+from synth import generate, load_app
+
+
+def bench(client, method: str, path: str, repeat: int, before=None, **kwargs) -> dict:
+    latencies, queries, errors = [], [], 0
+    for _ in range(repeat):
+        if before:
+            before()
+        t0 = time.perf_counter()
+        r = client.request(method, path, **kwargs)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        queries.append(int(r.headers.get("x-query-count", 0)))
+        errors += r.status_code >= 400
+    return summarize(latencies, queries, errors)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--mean-tx", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--login-repeat", type=int, default=5, help="bcrypt가 느리므로 따로")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/handlers-<commit>.json)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LEDGER_ASYNC_DB", "0")
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        ledger = generate(main, users=args.users, mean_tx=args.mean_tx, years=args.years, seed=args.seed)
+        heavy = ledger.users[0]
+        month = ledger.months[1]  # 지난달: 거래와 예산이 모두 있는 달
+        print(f"seeded {ledger.transactions:,} transactions for {len(ledger.users)} users in {ledger.seconds}s "
+              f"(heaviest user: {heavy.tx_count:,} tx, month={month})")
+
+        from fastapi.testclient import TestClient
+        with TestClient(main.app) as c:
+            token = c.post("/auth/login", data={"username": heavy.username, "password": ledger.password}).json()["access_token"]
+            h = {"Authorization": f"Bearer {token}"}
+            deep_cursor = None
+            for _ in range(10):  # 200건씩 10페이지 뒤의 커서 (거래가 적으면 마지막 페이지의 커서)
+                page = c.get("/transactions", params={"limit": 200, **({"cursor": deep_cursor} if deep_cursor else {})}, headers=h)
+                deep_cursor = page.headers.get("x-next-cursor") or deep_cursor
+
+            cold = lambda: main.report_cache.bump(heavy.id)  # 버전이 바뀌면 다음 요청은 캐시 미스
+            cases = {
+                "list_transactions": ("GET", "/transactions", {"params": {"limit": 50}}, None),
+                "list_transactions_month": ("GET", "/transactions", {"params": {"month": month, "limit": 50}}, None),
+                "list_transactions_deep_cursor": ("GET", "/transactions", {"params": {"limit": 50, "cursor": deep_cursor}}, None),
+                "search_transactions": ("GET", "/transactions", {"params": {"q": "카페", "limit": 50}}, None),
+                "search_transactions_relevance": ("GET", "/transactions", {"params": {"q": "카페", "sort": "relevance", "limit": 50}}, None),
+                "report_summary_cold": ("GET", "/reports/summary", {"params": {"month": month}}, cold),
+                "report_summary_warm": ("GET", "/reports/summary", {"params": {"month": month}}, None),
+                "report_budget_status_cold": ("GET", "/reports/budget-status", {"params": {"month": month}}, cold),
+                "report_budget_status_warm": ("GET", "/reports/budget-status", {"params": {"month": month}}, None),
+                "report_summary_csv_cold": ("GET", "/reports/summary.csv", {"params": {"month": month}}, cold),
+            }
+            results = {}
+            print(f"{'handler':<32}{'queries':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'errors':>8}")
+            for name, (method, path, kwargs, before) in cases.items():
+                c.request(method, path, headers=h, **kwargs)  # 워밍업
+                results[name] = bench(c, method, path, args.repeat, before, headers=h, **kwargs)
+            results["login"] = bench(c, "POST", "/auth/login", args.login_repeat,
+                                     data={"username": heavy.username, "password": ledger.password})
+            for name, r in results.items():
+                print(f"{name:<32}{r.get('queries_per_request', 0):>8}{r['p50_ms']:>10}{r['p90_ms']:>10}{r['p99_ms']:>10}{r['errors']:>8}")
+
+        params = dict(vars(args), transactions=ledger.transactions, heaviest_user_tx=heavy.tx_count, month=month)
+        os.chdir(ROOT)
+        print("saved", write_results("handlers", params, results, args.out))
+
+
+if __name__ == "__main__":
+    main_cli()
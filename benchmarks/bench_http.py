@@ -0,0 +1,139 @@
+"""
+HTTP 부하 시나리오 (uvicorn)
+===========================
+실행: python benchmarks/bench_http.py --users 50 --mean-tx 2000 --clients 20 --concurrency 64 --duration 30 [--workers 2]
+
+- synth.py로 임시 폴더에 가짜 장부를 만들고 같은 폴더에서 uvicorn(main:app)을 띄웁니다.
+- 사용자 --clients명이 로그인해 아래 비율로 섞인 요청을 --duration초 동안 동시에 보냅니다.
+    거래 목록 35% / 월 필터 목록 10% / 월 요약 20% / 예산 현황 15% / 요약 CSV 5% / 거래 생성 10% / 로그인 5%
+  사용자는 거래 수가 많은 순으로 뽑아 헤비 유저가 섞이게 하고, 조회 달은 최근 12개월 중 무작위입니다.
+- 엔드포인트별 p50/p90/p99, 초당 요청 수, 오류 수, 요청당 쿼리 수(X-Query-Count)를 JSON으로 저장합니다.
+- LEDGER_ASYNC_DB 등 환경변수는 서버에 그대로 전달됩니다.
+"""
+
+import argparse, asyncio, json, os, random, subprocess, sys, tempfile, time
+
+import httpx
+
+from bench_async import free_port, start_server
+from benchjson import ROOT, summarize, write_results
+
+SCENARIO = [
+    # (이름, 가중치)
+    ("list_transactions", 35),
+    ("list_transactions_month", 10),
+    ("report_summary", 20),
+    ("report_budget_status", 15),
+    ("report_summary_csv", 5),
+    ("create_transaction", 10),
+    ("login", 5),
+]
+
+
+def seed_workdir(workdir: str, args) -> dict:
+    """synth.py를 별도 프로세스로 실행해 workdir/app.db를 만들고, 사용자/계좌/카테고리 id를 돌려받음"""
+    out = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "synth.py"), "--workdir", workdir, "--json",
+         "--users", str(args.users), "--mean-tx", str(args.mean_tx), "--years", str(args.years), "--seed", str(args.seed)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+async def run_load(base: str, ledger: dict, args) -> dict:
+    rnd = random.Random(args.seed)
+    users = ledger["users"][: args.clients]
+    months = ledger["months"][1:13]
+    names = [n for n, _ in SCENARIO]
+    weights = [w for _, w in SCENARIO]
+    lat = {n: [] for n in names}
+    queries = {n: [] for n in names}
+    errors = {n: 0 for n in names}
+
+    async with httpx.AsyncClient(base_url=base, timeout=60, limits=httpx.Limits(max_connections=args.concurrency)) as client:
+        tokens = {}
+        for u in users:
+            r = await client.post("/auth/login", data={"username": u["username"], "password": ledger["password"]})
+            tokens[u["id"]] = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+        def request_for(name: str, user: dict):
+            h = tokens[user["id"]]
+            month = rnd.choice(months)
+            if name == "list_transactions":
+                return client.get("/transactions", params={"limit": 50}, headers=h)
+            if name == "list_transactions_month":
+                return client.get("/transactions", params={"month": month, "limit": 50}, headers=h)
+            if name == "report_summary":
+                return client.get("/reports/summary", params={"month": month}, headers=h)
+            if name == "report_budget_status":
+                return client.get("/reports/budget-status", params={"month": month}, headers=h)
+            if name == "report_summary_csv":
+                return client.get("/reports/summary.csv", params={"month": month}, headers=h)
+            if name == "create_transaction":
+                uid = str(user["id"])
+                return client.post("/transactions", headers=h, json={
+                    "account_id": rnd.choice(ledger["accounts"][uid]), "category_id": rnd.choice(ledger["categories"][uid]),
+                    "amount": str(rnd.randint(100, 100_000)), "description": "load", "date": time.strftime("%Y-%m-%d"),
+                })
+            return client.post("/auth/login", data={"username": user["username"], "password": ledger["password"]})
+
+        stop_at = time.perf_counter() + args.duration
+
+        async def worker():
+            while time.perf_counter() < stop_at:
+                name = rnd.choices(names, weights)[0]
+                user = rnd.choice(users)
+                t0 = time.perf_counter()
+                r = await request_for(name, user)
+                lat[name].append((time.perf_counter() - t0) * 1000)
+                if "x-query-count" in r.headers:
+                    queries[name].append(int(r.headers["x-query-count"]))
+                errors[name] += r.status_code >= 400
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - t0
+
+    results = {}
+    for n in names:
+        results[n] = dict(summarize(lat[n], queries[n], errors[n]), rps=round(len(lat[n]) / elapsed, 1))
+    all_lat = [x for n in names for x in lat[n]]
+    results["_total"] = dict(summarize(all_lat, None, sum(errors.values())), rps=round(len(all_lat) / elapsed, 1))
+    return results
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--mean-tx", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=20, help="로그인해서 요청을 보낼 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 프로세스 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/http-<commit>.json)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        ledger = seed_workdir(workdir, args)
+        print(f"seeded {ledger['transactions']:,} transactions for {len(ledger['users'])} users")
+        port = free_port()
+        proc = start_server(workdir, port, {}, workers=args.workers)
+        try:
+            results = asyncio.run(run_load(f"http://127.0.0.1:{port}", ledger, args))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    print(f"{'endpoint':<26}{'n':>8}{'rps':>9}{'queries':>9}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, r in results.items():
+        print(f"{name:<26}{r['n']:>8}{r['rps']:>9}{r.get('queries_per_request', '-'):>9}"
+              f"{str(r['p50_ms']):>10}{str(r['p90_ms']):>10}{str(r['p99_ms']):>10}{r['errors']:>8}")
+    params = dict(vars(args), transactions=ledger["transactions"],
+                  async_db=os.getenv("LEDGER_ASYNC_DB", "0"))
+    print("saved", write_results("http", params, results, args.out))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,162 @@
+"""
+소비 인사이트 벤치마크 — NumPy 열 파이프라인 vs ORM 객체를 행마다 도는 파이썬
+========================================================================
+실행: python benchmarks/bench_insights.py --users 20 --mean-tx 50000 --repeat 10 [--out result.json]
+      (기본값이면 약 100만 건 — 시드에 몇 분 걸립니다)
+
+- synth.py로 가짜 장부(사용자마다 월 정기 결제 3개 포함)를 만들고, 가장 거래가 많은 사용자의 지난달 인사이트를 계산합니다.
+- before: 같은 규칙을 ORM Transaction 객체 + 파이썬 루프/statistics로 구현한 참조 구현
+- after : GET /reports/insights (TestClient, 열 배열 로딩 + 벡터 연산), lookback 6/12/24개월
+- 두 구현이 찾은 카테고리 이상치/튀는 거래/정기 결제가 같은지도 확인합니다 (다르면 종료코드 1).
+"""
+
+import argparse, math, os, statistics, tempfile, time
+from collections import defaultdict
+from datetime import date, timedelta
+
+from benchjson import ROOT, summarize, write_results
+from synth import generate, load_app
+
+
+def reference_insights(main, db, user_id: int, month: str, lookback: int, as_of: date) -> dict:
+    """/reports/insights와 같은 규칙을 ORM 객체 위에서 행 단위로 — 결과 비교와 '예전 방식' 측정용"""
+    from sqlalchemy import select
+    T, C = main.Transaction, main.Category
+    month_start, end = main._month_range(month)
+    start = main._month_range(main._add_months(month, -lookback))[0]
+    labels = main._bucket_labels(start, end, "month")
+    days_in_month = (end - month_start).days
+    elapsed = min(max((as_of - month_start).days + 1, 0), days_in_month)
+    txs = db.execute(
+        select(T).join(C, C.id == T.category_id)
+        .where(T.user_id == user_id, C.type == "expense", T.date >= start, T.date < end)
+    ).scalars().all()
+    if not txs:
+        return {"category_anomalies": set(), "transaction_anomalies": set(), "recurring": set()}
+    idx = {m: i for i, m in enumerate(labels)}
+    first = min(idx[main._month_key(t.date)] for t in txs)
+
+    # 카테고리 이상치: 같은 날짜까지 지출
+    to_date = defaultdict(lambda: [0.0] * len(labels))
+    for t in txs:
+        if t.date.day <= elapsed:
+            to_date[t.category_id][idx[main._month_key(t.date)]] += float(t.amount)
+    category_anomalies = set()
+    if lookback - first >= 2:
+        for cat, series in to_date.items():
+            history = series[first:lookback]
+            std = statistics.stdev(history)
+            if std > 0 and abs((series[lookback] - statistics.fmean(history)) / std) >= main.INSIGHT_Z_THRESHOLD:
+                category_anomalies.add(cat)
+
+    # 튀는 거래: log 금액 z-score
+    past = defaultdict(list)
+    for t in txs:
+        if idx[main._month_key(t.date)] < lookback:
+            past[t.category_id].append(math.log(max(float(t.amount) * 100, 1)))
+    stats = {cat: (statistics.fmean(logs), statistics.stdev(logs))
+             for cat, logs in past.items() if len(logs) >= main.INSIGHT_TX_MIN_HISTORY}
+    transaction_anomalies = set()
+    for t in txs:
+        if idx[main._month_key(t.date)] == lookback and t.category_id in stats:
+            mu, sigma = stats[t.category_id]
+            if sigma > 0 and (math.log(max(float(t.amount) * 100, 1)) - mu) / sigma >= main.INSIGHT_TX_Z_THRESHOLD:
+                transaction_anomalies.add(t.id)
+
+    # 정기 결제
+    groups = defaultdict(list)
+    for t in txs:
+        key = main._normalize_description(t.description)
+        if key:
+            groups[key].append(t)
+    recurring = set()
+    as_of_day = (as_of - start).days
+    for key, items in groups.items():
+        items.sort(key=lambda t: (t.date, t.id))
+        if len(items) < main.RECURRING_MIN_OCCURRENCES:
+            continue
+        amounts = [float(t.amount) * 100 for t in items]
+        gaps = [(b.date - a.date).days for a, b in zip(items, items[1:])]
+        gap_mean, gap_std = statistics.fmean(gaps), statistics.pstdev(gaps)
+        mean_amount = statistics.fmean(amounts)
+        if not any(lo <= gap_mean <= hi for _, lo, hi in main.RECURRING_CADENCES):
+            continue
+        if mean_amount <= 0 or statistics.pstdev(amounts) / mean_amount > main.RECURRING_MAX_AMOUNT_CV:
+            continue
+        if gap_std <= gap_mean * 0.1 + 1.5 and (items[-1].date - start).days + gap_mean * 1.5 >= as_of_day:
+            recurring.add(items[-1].description)
+    return {"category_anomalies": category_anomalies, "transaction_anomalies": transaction_anomalies, "recurring": recurring}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--mean-tx", type=int, default=50_000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/insights-<commit>.json)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LEDGER_ASYNC_DB", "0")
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        ledger = generate(main, users=args.users, mean_tx=args.mean_tx, years=args.years, subscriptions=3, seed=args.seed)
+        heavy = ledger.users[0]
+        month = ledger.months[1]
+        as_of = main._month_range(month)[1] - timedelta(days=1)
+        print(f"seeded {ledger.transactions:,} transactions for {len(ledger.users)} users in {ledger.seconds}s "
+              f"(heaviest user: {heavy.tx_count:,} tx, month={month})")
+
+        from fastapi.testclient import TestClient
+        results, mismatches = {}, 0
+        with TestClient(main.app) as c:
+            token = c.post("/auth/login", data={"username": heavy.username, "password": ledger.password}).json()["access_token"]
+            h = {"Authorization": f"Bearer {token}"}
+            print(f"{'case':<28}{'rows':>9}{'p50 ms':>12}{'p99 ms':>12}")
+            for lookback in (6, 12, 24):
+                params = {"month": month, "lookback": lookback, "as_of": as_of.isoformat()}
+                latencies = []
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    r = c.get("/reports/insights", params=params, headers=h)
+                    latencies.append((time.perf_counter() - t0) * 1000)
+                body = r.json()
+                results[f"numpy_lookback_{lookback}"] = dict(summarize(latencies), rows=body["transactions_analyzed"])
+
+                db = main.SessionLocal()
+                latencies = []
+                for _ in range(max(args.repeat // 5, 1)):
+                    db.expunge_all()
+                    t0 = time.perf_counter()
+                    ref = reference_insights(main, db, heavy.id, month, lookback, as_of)
+                    latencies.append((time.perf_counter() - t0) * 1000)
+                db.close()
+                results[f"python_orm_lookback_{lookback}"] = dict(summarize(latencies), rows=body["transactions_analyzed"])
+
+                got = {
+                    "category_anomalies": {a["category_id"] for a in body["category_anomalies"]},
+                    "transaction_anomalies": {a["transaction_id"] for a in body["transaction_anomalies"]},
+                    "recurring": {p["description"] for p in body["recurring"]},
+                }
+                for key in got:  # API는 목록마다 INSIGHT_MAX_ITEMS개까지만 돌려줌
+                    expected = ref[key]
+                    same = got[key] == expected if len(expected) <= main.INSIGHT_MAX_ITEMS else got[key] <= expected
+                    if not same:
+                        mismatches += 1
+                        print(f"  MISMATCH lookback={lookback} {key}: api={sorted(got[key])} reference={sorted(expected)}")
+                for name in (f"python_orm_lookback_{lookback}", f"numpy_lookback_{lookback}"):
+                    print(f"{name:<28}{results[name]['rows']:>9,}{results[name]['p50_ms']:>12}{results[name]['p99_ms']:>12}")
+                print(f"  found: {len(body['category_anomalies'])} category anomalies, {len(body['transaction_anomalies'])} "
+                      f"unusual transactions, {len(body['recurring'])} recurring payments")
+
+        params = dict(vars(args), transactions=ledger.transactions, heaviest_user_tx=heavy.tx_count, month=month,
+                      mismatches=mismatches)
+        os.chdir(ROOT)
+        print("saved", write_results("insights", params, results, args.out))
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
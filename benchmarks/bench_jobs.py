@@ -0,0 +1,92 @@
+"""
+백그라운드 리포트 작업 벤치마크 — 큰 내보내기가 도는 동안 일반 요청 지연
+=====================================================================
+실행: python benchmarks/bench_jobs.py --users 10 --mean-tx 20000 --jobs 4 --repeat 200 [--out result.json]
+
+- synth.py로 가짜 장부를 만들고, 가장 거래가 많은 사용자들의 전체 기간 CSV 내보내기를 POST /reports/jobs로 --jobs개 요청합니다.
+- 작업이 도는 동안과 아무 작업도 없을 때 GET /reports/summary, GET /transactions 지연(p50/p99)을 비교합니다.
+- 작업별 소요 시간(created_at → finished_at)과 결과 크기, 거절(429/503) 수도 함께 저장합니다.
+"""
+
+import argparse, os, tempfile, time
+
+from benchjson import ROOT, summarize, write_results
+from synth import generate, load_app
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--mean-tx", type=int, default=20_000)
+    parser.add_argument("--jobs", type=int, default=4, help="동시에 요청할 내보내기 작업 수 (사용자마다 하나)")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/jobs-<commit>.json)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LEDGER_ASYNC_DB", "0")
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        ledger = generate(main, users=args.users, mean_tx=args.mean_tx, seed=args.seed)
+        month = ledger.months[1]
+        print(f"seeded {ledger.transactions:,} transactions; {main.REPORT_JOB_WORKERS} job workers")
+
+        from fastapi.testclient import TestClient
+        results = {}
+        with TestClient(main.app) as c:
+            login = lambda u: {"Authorization": "Bearer " + c.post(
+                "/auth/login", data={"username": u.username, "password": ledger.password}).json()["access_token"]}
+            exporters = [login(u) for u in ledger.users[: args.jobs]]
+            h = login(ledger.users[-1])
+
+            def probe(label: str, until=None) -> None:
+                """요약/목록 요청을 번갈아 보냄 (until이 참이 되면 중단)"""
+                cases = (("summary", "/reports/summary", {"month": month}), ("transactions", "/transactions", {"limit": 50}))
+                latencies = {name: [] for name, _, _ in cases}
+                for i in range(args.repeat):
+                    if until is not None and i % 10 == 0 and until():
+                        break
+                    for name, path, params in cases:
+                        t0 = time.perf_counter()
+                        c.get(path, params=params, headers=h)
+                        latencies[name].append((time.perf_counter() - t0) * 1000)
+                for name, values in latencies.items():
+                    results[f"{name}_{label}"] = summarize(values)
+
+            probe("idle")
+
+            t0 = time.perf_counter()
+            ids, rejected = [], 0
+            for hx in exporters:
+                r = c.post("/reports/jobs", json={"kind": "transactions-csv", "params": {}}, headers=hx)
+                if r.status_code == 202:
+                    ids.append((r.json()["id"], hx))
+                else:
+                    rejected += 1
+            post_ms = (time.perf_counter() - t0) * 1000
+
+            def all_done() -> bool:
+                return all(c.get(f"/reports/jobs/{jid}", headers=hx).json()["status"] in ("done", "failed") for jid, hx in ids)
+
+            probe("during_jobs", until=all_done)
+            while not all_done():
+                time.sleep(0.1)
+            elapsed = time.perf_counter() - t0
+            jobs = [c.get(f"/reports/jobs/{jid}", headers=hx).json() for jid, hx in ids]
+
+        for j in jobs:
+            seconds = (main.datetime.fromisoformat(j["finished_at"]) - main.datetime.fromisoformat(j["created_at"])).total_seconds()
+            print(f"job {j['id'][:8]} {j['status']:<6} {j['size_bytes'] or 0:>12,} bytes {seconds:>7.2f}s")
+        print(f"{'case':<28}{'n':>6}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, r in results.items():
+            print(f"{name:<28}{r['n']:>6}{str(r['p50_ms']):>10}{str(r['p99_ms']):>10}")
+        results["jobs"] = {"n": len(jobs), "rejected": rejected, "post_ms": round(post_ms, 2), "all_done_s": round(elapsed, 2),
+                           "bytes": sum(j["size_bytes"] or 0 for j in jobs), "failed": sum(j["status"] == "failed" for j in jobs)}
+
+        params = dict(vars(args), transactions=ledger.transactions, workers=main.REPORT_JOB_WORKERS)
+        os.chdir(ROOT)
+        print("saved", write_results("jobs", params, results, args.out))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,61 @@
+"""
+거래 목록 페이지네이션 벤치마크 — offset vs cursor(키셋)
+=====================================================
+실행: python benchmarks/bench_pagination.py --rows 1000000 --page 500
+
+- bench_reports.py와 같은 시드 데이터를 사용합니다.
+- 1페이지와 N페이지(limit=50)를 offset 방식과 cursor 방식으로 각각 조회해 p50/p95(ms)를 비교합니다.
+"""
+
+import argparse, json, os, tempfile, time
+from datetime import date
+
+from bench_reports import ROOT, load_app, seed, measure
+
+
+def list_page(main, db, user, limit, offset=0, cursor=None):
+    response = main.list_transactions(
+        month=None, account_id=None, category_id=None, amount_min=None, amount_max=None,
+        start_date=None, end_date=None, search=None, sort="date", limit=limit, offset=offset, cursor=cursor,
+        db=db, current=user,
+    )
+    return json.loads(response.body)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        t0 = time.perf_counter()
+        user_id, _ = seed(main, args.rows)
+        print(f"seeded {args.rows:,} transactions in {time.perf_counter() - t0:.1f}s")
+
+        db = main.SessionLocal()
+        user = db.get(main.User, user_id)
+        # N페이지 직전 행의 커서 (측정 밖에서 한 번만 계산)
+        prev = list_page(main, db, user, 1, offset=(args.page - 1) * args.limit - 1)[-1]
+        deep_cursor = main._encode_cursor(date.fromisoformat(prev["date"]), prev["id"])
+        db.close()
+
+        deep_offset = (args.page - 1) * args.limit
+        cases = [
+            ("offset", "page 1", lambda db: list_page(main, db, user, args.limit)),
+            ("cursor", "page 1", lambda db: list_page(main, db, user, args.limit, cursor=None)),
+            ("offset", f"page {args.page}", lambda db: list_page(main, db, user, args.limit, offset=deep_offset)),
+            ("cursor", f"page {args.page}", lambda db: list_page(main, db, user, args.limit, cursor=deep_cursor)),
+        ]
+        print(f"{'mode':<8}{'page':<12}{'queries':>8}{'p50 ms':>12}{'p95 ms':>12}")
+        for mode, page, fn in cases:
+            r = measure(main, fn, args.repeat)
+            print(f"{mode:<8}{page:<12}{r['queries']:>8}{r['p50_ms']:>12}{r['p95_ms']:>12}")
+        os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    main_cli()
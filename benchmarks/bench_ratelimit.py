@@ -0,0 +1,92 @@
+"""
+요청 한도(토큰 버킷) 벤치마크 — 요청당 오버헤드와 한도 동작
+=========================================================
+실행: python benchmarks/bench_ratelimit.py --repeat 2000 [--out result.json]
+
+- 저장소 단독: InMemoryRateLimitStore.take / RateLimiter.hit 한 번에 드는 시간(µs)
+- 핸들러 경로: 같은 GET /transactions?limit=20 을 한도 끔/켬(버킷은 충분히 크게)으로 번갈아 측정해 p50 차이를 봄
+- 동작: 한 사용자가 /reports/summary 를 쉬지 않고 부를 때 몇 번째에 429가 나오는지, 그동안 가끔 부르는 다른 사용자는 200인지 확인
+"""
+
+import argparse, os, tempfile, time
+
+from benchjson import ROOT, summarize, write_results
+from synth import generate, load_app
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--mean-tx", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/ratelimit-<commit>.json)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LEDGER_ASYNC_DB", "0")
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        ledger = generate(main, users=args.users, mean_tx=args.mean_tx, seed=args.seed)
+        results = {}
+
+        store = main.InMemoryRateLimitStore()
+        limiter = main.RateLimiter(store, enabled=True)
+        n = args.repeat * 50
+        t0 = time.perf_counter()
+        for i in range(n):
+            store.take(f"user:{i % 1000}", 1, 20, 200, time.time())
+        results["store_take"] = {"n": n, "us_per_call": round((time.perf_counter() - t0) / n * 1e6, 3)}
+        t0 = time.perf_counter()
+        for i in range(n):
+            limiter.hit(f"user:{i % 1000}", 1, 20, 200)
+        results["limiter_hit"] = {"n": n, "us_per_call": round((time.perf_counter() - t0) / n * 1e6, 3)}
+
+        from fastapi.testclient import TestClient
+        with TestClient(main.app) as c:
+            login = lambda u: {"Authorization": "Bearer " + c.post(
+                "/auth/login", data={"username": u.username, "password": ledger.password}).json()["access_token"]}
+            heavy, other = login(ledger.users[0]), login(ledger.users[1])
+
+            # 오버헤드: 한도는 켜되 버킷을 충분히 크게 → 429 없이 검사 비용만
+            main.RATE_LIMIT_USER_BURST = main.RATE_LIMIT_USER_RATE = 1e9
+            latencies = {False: [], True: []}
+            for i in range(args.repeat * 2):
+                enabled = bool(i % 2)
+                main.rate_limiter.enabled = enabled
+                t0 = time.perf_counter()
+                r = c.get("/transactions", params={"limit": 20}, headers=heavy)
+                latencies[enabled].append((time.perf_counter() - t0) * 1000)
+                assert r.status_code == 200, r.text
+            results["transactions_limit_off"] = summarize(latencies[False])
+            results["transactions_limit_on"] = summarize(latencies[True])
+
+            # 동작: 기본 한도로 되돌리고 한 사용자가 리포트를 연달아 호출
+            main.RATE_LIMIT_USER_RATE, main.RATE_LIMIT_USER_BURST = 20.0, 200.0
+            main.rate_limiter.enabled = True
+            main.rate_limiter.store.clear()
+            month = ledger.months[1]
+            first_429, other_ok, retry_after = None, 0, None
+            for i in range(1, 201):
+                r = c.get("/reports/summary", params={"month": month}, headers=heavy)
+                if r.status_code == 429 and first_429 is None:
+                    first_429, retry_after = i, r.headers.get("retry-after")
+                if i % 10 == 0:  # 다른 사용자는 평범한 빈도로
+                    other_ok += c.get("/reports/summary", params={"month": month}, headers=other).status_code == 200
+            results["tight_loop"] = {"n": 200, "first_429_at": first_429, "retry_after": retry_after,
+                                     "other_user_ok": other_ok, "limited_total": main.rate_limiter.limited}
+
+        print(f"store.take {results['store_take']['us_per_call']} µs, limiter.hit {results['limiter_hit']['us_per_call']} µs")
+        for name in ("transactions_limit_off", "transactions_limit_on"):
+            r = results[name]
+            print(f"{name:<26} p50 {r['p50_ms']} ms  p99 {r['p99_ms']} ms")
+        t = results["tight_loop"]
+        print(f"tight loop on /reports/summary: first 429 at request {t['first_429_at']} (Retry-After {t['retry_after']}s), "
+              f"other user {t['other_user_ok']}/20 ok")
+
+        params = dict(vars(args), transactions=ledger.transactions)
+        os.chdir(ROOT)
+        print("saved", write_results("ratelimit", params, results, args.out))
+
+
+if __name__ == "__main__":
+    main_cli()
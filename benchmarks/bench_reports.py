@@ -0,0 +1,165 @@
+"""
+리포트 집계 벤치마크 — 예전 방식 vs 공용 집계 엔진
+================================================
+실행: python benchmarks/bench_reports.py --rows 1000000
+
+- 임시 폴더에 SQLite DB(app.db)를 만들고 거래 N건을 시드합니다.
+- before: 원래 report_summary / report_budget_status 의 쿼리 모양(거래 테이블을 매번 GROUP BY)
+- after : 현재 핸들러(롤업 + 예산 LEFT JOIN을 한 번의 SQL로)
+- 요청당 쿼리 수와 지연시간(p50/p95, ms)을 출력합니다.
+"""
+
+import argparse, os, random, statistics, sys, tempfile, time
+from datetime import date, timedelta
+from decimal import Decimal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_app(workdir: str):
+    """main.py는 ./app.db를 쓰므로 임시 폴더로 이동한 뒤 import"""
+    os.chdir(workdir)
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "0")  # 같은 사용자로 연달아 요청하므로 한도는 끔
+    sys.path.insert(0, ROOT)
+    import main
+    return main
+
+
+def seed(main, rows: int, years: int = 5, seed_value: int = 42):
+    rnd = random.Random(seed_value)
+    db = main.SessionLocal()
+    user = main.User(username="bench", email="bench@example.com", password_hash="x", role="user")
+    db.add(user); db.flush()
+    accounts = [main.Account(user_id=user.id, account_name=f"acc{i}", balance=0) for i in range(3)]
+    cats = [main.Category(user_id=user.id, name=f"exp{i}", type="expense") for i in range(10)]
+    cats += [main.Category(user_id=user.id, name=f"inc{i}", type="income") for i in range(2)]
+    db.add_all(accounts + cats); db.flush()
+
+    start = date.today() - timedelta(days=365 * years)
+    span = 365 * years
+    table = main.Transaction.__table__
+    chunk = 50_000
+    for off in range(0, rows, chunk):
+        batch = []
+        for _ in range(min(chunk, rows - off)):
+            batch.append({
+                "user_id": user.id,
+                "account_id": rnd.choice(accounts).id,
+                "category_id": rnd.choice(cats).id,
+                "amount": Decimal(rnd.randint(100, 200_000)),
+                "description": "",
+                "date": start + timedelta(days=rnd.randrange(span)),
+            })
+        db.execute(table.insert(), batch)  # executemany
+    db.commit()
+
+    month = main._month_key(date.today() - timedelta(days=30))
+    for c in cats:
+        if c.type == "expense":
+            db.add(main.Budget(user_id=user.id, category_id=c.id, month=month, amount=Decimal(500_000)))
+    db.commit()
+    main.rebuild_rollups(db)
+    user_id = user.id
+    db.close()
+    return user_id, month
+
+
+# ---- before: 원래 구현의 쿼리 모양 그대로 ----
+def legacy_report_summary(main, db, user_id, month):
+    from sqlalchemy import select, func
+    T, C, A = main.Transaction, main.Category, main.Account
+    start, end = main._month_range(month)
+    for typ in ("income", "expense"):
+        db.execute(
+            select(func.coalesce(func.sum(T.amount), 0))
+            .join(C, C.id == T.category_id).join(A, A.id == T.account_id)
+            .where(A.user_id == user_id, C.type == typ)
+            .where(T.date >= start, T.date < end)
+        ).scalar_one()
+    db.execute(select(C).where(C.user_id == user_id).order_by(C.type, C.name)).scalars().all()
+    db.execute(
+        select(C.id, C.name, C.type, func.coalesce(func.sum(T.amount), 0))
+        .join(T, T.category_id == C.id, isouter=True)
+        .join(A, A.id == T.account_id, isouter=True)
+        .where(C.user_id == user_id)
+        .where((T.date >= start) & (T.date < end))
+        .group_by(C.id)
+    ).all()
+
+
+def legacy_report_budget_status(main, db, user_id, month):
+    from sqlalchemy import select, func
+    T, C, A, B = main.Transaction, main.Category, main.Account, main.Budget
+    start, end = main._month_range(month)
+    db.execute(
+        select(C.id, C.name, func.coalesce(func.sum(T.amount), 0))
+        .join(T, T.category_id == C.id, isouter=True)
+        .join(A, A.id == T.account_id, isouter=True)
+        .where(C.user_id == user_id, C.type == "expense")
+        .where((T.date >= start) & (T.date < end))
+        .group_by(C.id)
+    ).all()
+    db.execute(select(B).where(B.user_id == user_id, B.month == month)).scalars().all()
+    db.execute(select(C).where(C.user_id == user_id, C.type == "expense").order_by(C.name)).scalars().all()
+
+
+def measure(main, fn, repeat: int):
+    from sqlalchemy import event
+    counter = {"n": 0}
+
+    def _count(*_):
+        counter["n"] += 1
+
+    event.listen(main.engine, "before_cursor_execute", _count)
+    times = []
+    try:
+        for _ in range(repeat):
+            db = main.SessionLocal()
+            counter["n"] = 0
+            t0 = time.perf_counter()
+            fn(db)
+            times.append((time.perf_counter() - t0) * 1000)
+            db.close()
+    finally:
+        event.remove(main.engine, "before_cursor_execute", _count)
+    times.sort()
+    return {
+        "queries": counter["n"],
+        "p50_ms": round(statistics.median(times), 3),
+        "p95_ms": round(times[int(len(times) * 0.95) - 1] if len(times) > 1 else times[0], 3),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        t0 = time.perf_counter()
+        user_id, month = seed(main, args.rows)
+        print(f"seeded {args.rows:,} transactions in {time.perf_counter() - t0:.1f}s (month={month})")
+
+        db = main.SessionLocal()
+        user = db.get(main.User, user_id)
+        db.close()
+
+        cases = [
+            ("report_summary", "before", lambda db: legacy_report_summary(main, db, user_id, month)),
+            ("report_summary", "after", lambda db: main.report_summary(month, db, user)),
+            ("report_budget_status", "before", lambda db: legacy_report_budget_status(main, db, user_id, month)),
+            ("report_budget_status", "after", lambda db: main.report_budget_status(month, db, user)),
+            ("budget_summary", "after", lambda db: main.budget_summary(month, db, user)),
+            ("report_summary_csv", "after", lambda db: main.report_summary_csv(month, db, user)),
+        ]
+        print(f"{'endpoint':<24}{'path':<8}{'queries':>8}{'p50 ms':>12}{'p95 ms':>12}")
+        for name, path, fn in cases:
+            r = measure(main, fn, args.repeat)
+            print(f"{name:<24}{path:<8}{r['queries']:>8}{r['p50_ms']:>12}{r['p95_ms']:>12}")
+        os.chdir(ROOT)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,96 @@
+"""
+워커 수에 따른 처리량 — 같은 DB, 같은 부하로 1 → N 프로세스
+=========================================================
+실행: python benchmarks/bench_scaling.py --workers 1 2 4 --concurrency 64 --duration 20 [--database-url postgresql+psycopg://...]
+
+- synth.py로 가짜 장부를 한 번 만들고(기본: 임시 폴더의 SQLite WAL, --database-url이면 그 DB),
+  워커 수마다 `python main.py serve --workers N`을 운영 모드(LEDGER_ENV=production)로 띄웁니다.
+- 부하는 bench_http.py와 같은 시나리오(목록/요약/예산 현황/CSV/거래 생성/로그인 혼합)
+- 워커 수별 초당 요청 수, p50/p99, 오류 수, 1워커 대비 배율을 JSON으로 저장합니다.
+- 공정한 비교를 위해 요청 한도와 리포트 캐시는 끔 (--cache-backend redis로 공유 캐시를 켠 채 측정 가능)
+- 배율은 CPU 코어 수를 넘을 수 없습니다 — 결과의 params.cpus를 같이 보세요.
+"""
+
+import argparse, asyncio, os, secrets, subprocess, sys, tempfile, time
+
+import httpx
+
+from bench_async import free_port
+from bench_http import run_load, seed_workdir
+from benchjson import ROOT, write_results
+
+
+def start_serve(workdir: str, port: int, workers: int, env_extra: dict) -> subprocess.Popen:
+    """main.py serve로 워커 N개를 띄우고 /healthz, /readyz가 응답할 때까지 기다림"""
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py"), "serve", "--workers", str(workers),
+         "--host", "127.0.0.1", "--port", str(port), "--no-migrate"],
+        cwd=workdir, env=dict(os.environ, **env_extra),
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/healthz").status_code == 200:
+                if httpx.get(f"http://127.0.0.1:{port}/readyz").status_code != 200:
+                    raise RuntimeError("server is up but /readyz failed")
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("server did not start")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--mean-tx", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=20, help="로그인해서 요청을 보낼 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--database-url", default=None, help="비우면 임시 폴더의 SQLite(WAL)")
+    parser.add_argument("--cache-backend", default="memory", help="CACHE_BACKEND (memory | redis)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/scaling-<커밋>.json)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'app.db')}"
+        os.environ["DATABASE_URL"] = database_url  # synth.py(개발 모드, create_all)도 같은 DB에 시드
+        ledger = seed_workdir(workdir, args)
+        print(f"seeded {ledger['transactions']:,} transactions for {len(ledger['users'])} users "
+              f"({database_url.split(':')[0]}, {os.cpu_count()} CPUs)")
+
+        env = {
+            "LEDGER_ENV": "production",
+            "SECRET_KEY": secrets.token_urlsafe(32),
+            "DATABASE_URL": database_url,
+            "CACHE_BACKEND": args.cache_backend,
+            "REPORT_CACHE_BACKEND": "off" if args.cache_backend == "memory" else args.cache_backend,
+            "RATE_LIMIT_ENABLED": "0",
+        }
+        results = {}
+        print(f"{'workers':<10}{'n':>8}{'rps':>9}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}{'speedup':>9}")
+        for n in args.workers:
+            port = free_port()
+            proc = start_serve(workdir, port, n, env)
+            try:
+                total = asyncio.run(run_load(f"http://127.0.0.1:{port}", ledger, args))["_total"]
+            finally:
+                proc.terminate()
+                proc.wait()
+            base = results.get(f"workers_{args.workers[0]}", total)
+            total["speedup"] = round(total["rps"] / max(base["rps"], 1e-9), 2)
+            results[f"workers_{n}"] = total
+            print(f"{n:<10}{total['n']:>8}{total['rps']:>9}{str(total['p50_ms']):>10}{str(total['p99_ms']):>10}"
+                  f"{total['errors']:>8}{total['speedup']:>8}x")
+
+    params = dict(vars(args), transactions=ledger["transactions"], cpus=os.cpu_count(),
+                  database=database_url.split(":")[0])
+    params.pop("database_url")  # 비밀번호가 들어 있을 수 있음
+    print("saved", write_results("scaling", params, results, args.out))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,99 @@
+"""
+거래 목록 직렬화 벤치마크 — ORM + Pydantic vs 칼럼 튜플 + FastJSONResponse
+=======================================================================
+실행: python benchmarks/bench_serialization.py --users 10 --mean-tx 2000 --limit 200 --repeat 200 [--out result.json]
+
+- synth.py로 가짜 장부를 만들고 가장 거래가 많은 사용자의 첫 페이지(limit행)를 반복해서 만듭니다.
+- before: 예전 list_transactions — select(Transaction) ORM 객체 → List[TransactionOut] 검증(from_attributes)
+          → JSON 기본형으로 변환 → 표준 json 인코딩 (FastAPI response_model 경로와 같은 단계)
+- after : 현재 list_transactions — 필요한 칼럼만 튜플로 → dict → FastJSONResponse (orjson, 없으면 표준 json)
+- 페이지당 CPU 시간(time.process_time, 쿼리 포함)과 벽시계 시간을 비교하고, 두 응답 본문이 같은 JSON인지 확인합니다
+  (Decimal 금액이 "12000.00" 같은 정확한 문자열로 나오는지 포함).
+"""
+
+import argparse, json, os, tempfile, time
+from typing import List
+
+from benchjson import ROOT, summarize, write_results
+from synth import generate, load_app
+
+
+def measure(fn, repeat: int) -> dict:
+    wall, cpu = [], []
+    for _ in range(repeat):
+        w0, c0 = time.perf_counter(), time.process_time()
+        fn()
+        cpu.append((time.process_time() - c0) * 1000)
+        wall.append((time.perf_counter() - w0) * 1000)
+    out = summarize(wall)
+    out["cpu_ms_per_page"] = round(sum(cpu) / len(cpu), 3)
+    return out
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--mean-tx", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/serialization-<commit>.json)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LEDGER_ASYNC_DB", "0")
+    with tempfile.TemporaryDirectory() as workdir:
+        main = load_app(workdir)
+        ledger = generate(main, users=args.users, mean_tx=args.mean_tx, seed=args.seed)
+        heavy = ledger.users[0]
+        print(f"seeded {ledger.transactions:,} transactions (heaviest user: {heavy.tx_count:,} tx), page size {args.limit}")
+
+        from fastapi.responses import JSONResponse
+        from pydantic import TypeAdapter
+        from sqlalchemy import select
+
+        T = main.Transaction
+        adapter = TypeAdapter(List[main.TransactionOut])
+        db = main.SessionLocal()
+        current = main.CurrentUser(id=heavy.id, username=heavy.username, role="user")
+
+        def before() -> bytes:
+            db.expunge_all()  # 요청마다 새 세션이었던 것과 같게 identity map을 비움
+            rows = db.execute(
+                select(T).where(T.user_id == heavy.id).order_by(T.date.desc(), T.id.desc()).limit(args.limit)
+            ).scalars().all()
+            validated = adapter.validate_python(rows, from_attributes=True)
+            return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+        def after() -> bytes:
+            return main.list_transactions(
+                month=None, account_id=None, category_id=None, amount_min=None, amount_max=None,
+                start_date=None, end_date=None, search=None, sort="date", limit=args.limit, offset=0, cursor=None,
+                db=db, current=current,
+            ).body
+
+        old_body, new_body = before(), after()
+        same = json.loads(old_body) == json.loads(new_body)
+        print(f"same JSON: {same} ({len(new_body):,} bytes, encoder: {'orjson' if main.orjson else 'json'})")
+
+        results = {}
+        for name, fn in (("before_orm_pydantic", before), ("after_tuples_fastjson", after)):
+            fn()  # 워밍업
+            results[name] = measure(fn, args.repeat)
+        db.close()
+
+        print(f"{'path':<26}{'cpu ms/page':>12}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, r in results.items():
+            print(f"{name:<26}{r['cpu_ms_per_page']:>12}{r['p50_ms']:>10}{r['p99_ms']:>10}")
+        speedup = results["before_orm_pydantic"]["cpu_ms_per_page"] / max(results["after_tuples_fastjson"]["cpu_ms_per_page"], 1e-9)
+        print(f"CPU per page: {speedup:.1f}x less")
+
+        params = dict(vars(args), transactions=ledger.transactions, same_json=same,
+                      encoder="orjson" if main.orjson else "json")
+        os.chdir(ROOT)
+        print("saved", write_results("serialization", params, results, args.out))
+    if not same:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
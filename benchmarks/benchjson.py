@@ -0,0 +1,66 @@
+"""
+벤치마크 결과 JSON 공통 모듈
+==========================
+- summarize(): 지연시간(ms) 목록 → n/mean/p50/p90/p99/max (+ 요청당 쿼리 수)
+- write_results(): 커밋 해시/실행 환경/파라미터와 함께 benchmarks/results/<kind>-<commit>.json 으로 저장
+- 저장한 파일끼리는 benchmarks/compare.py 로 비교합니다.
+"""
+
+import json, os, platform, statistics, subprocess, sys, time
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """최근접 순위(nearest-rank) 방식 — 표본이 작아도 실제 관측값 중 하나를 돌려줌"""
+    if not sorted_values:
+        return 0.0
+    k = max(int(round(q / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(k, len(sorted_values) - 1)]
+
+
+def summarize(latencies_ms: List[float], queries: Optional[List[int]] = None, errors: int = 0) -> dict:
+    values = sorted(latencies_ms)
+    out = {
+        "n": len(values),
+        "errors": errors,
+        "mean_ms": round(statistics.fmean(values), 3) if values else None,
+        "p50_ms": round(percentile(values, 50), 3) if values else None,
+        "p90_ms": round(percentile(values, 90), 3) if values else None,
+        "p99_ms": round(percentile(values, 99), 3) if values else None,
+        "max_ms": round(values[-1], 3) if values else None,
+    }
+    if queries:
+        out["queries_per_request"] = round(statistics.fmean(queries), 2)
+    return out
+
+
+def git_revision() -> dict:
+    def git(*args) -> str:
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown", "dirty": bool(git("status", "--porcelain", "--", "main.py"))}
+
+
+def write_results(kind: str, params: dict, results: dict, out: Optional[str] = None) -> str:
+    rev = git_revision()
+    doc = {
+        "kind": kind,
+        **rev,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        suffix = "-dirty" if rev["dirty"] else ""
+        out = os.path.join(RESULTS_DIR, f"{kind}-{rev['commit']}{suffix}.json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    return out
@@ -0,0 +1,59 @@
+"""
+벤치마크 결과 JSON 두 개 비교 (회귀 감지)
+======================================
+실행: python benchmarks/compare.py benchmarks/results/handlers-abc123.json benchmarks/results/handlers-def456.json
+      [--threshold 15] [--min-ms 0.5]
+
+- 같은 이름의 항목마다 p50/p99와 요청당 쿼리 수를 나란히 보여 줍니다.
+- p50 또는 p99가 threshold% 넘게 (그리고 min-ms 넘게) 느려졌거나, 요청당 쿼리 수가 늘었으면 REGRESSION 표시 + 종료코드 1
+"""
+
+import argparse, json, sys
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def regressed(old, new, threshold: float, min_ms: float) -> bool:
+    if old is None or new is None:
+        return False
+    return new - old > min_ms and new > old * (1 + threshold / 100)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=15.0, help="허용하는 지연 증가율(%%)")
+    parser.add_argument("--min-ms", type=float, default=0.5, help="이보다 작은 절대 증가는 잡음으로 무시")
+    args = parser.parse_args()
+
+    old, new = load(args.old), load(args.new)
+    if old.get("kind") != new.get("kind"):
+        print(f"warning: comparing different kinds ({old.get('kind')} vs {new.get('kind')})")
+    print(f"old: {old.get('commit')}{' (dirty)' if old.get('dirty') else ''} {old.get('timestamp')}")
+    print(f"new: {new.get('commit')}{' (dirty)' if new.get('dirty') else ''} {new.get('timestamp')}")
+    print(f"{'name':<32}{'p50 old':>10}{'p50 new':>10}{'p99 old':>10}{'p99 new':>10}{'q old':>7}{'q new':>7}")
+
+    failures = 0
+    for name in sorted(old["results"].keys() & new["results"].keys()):
+        o, n = old["results"][name], new["results"][name]
+        qo, qn = o.get("queries_per_request"), n.get("queries_per_request")
+        bad = (
+            regressed(o.get("p50_ms"), n.get("p50_ms"), args.threshold, args.min_ms)
+            or regressed(o.get("p99_ms"), n.get("p99_ms"), args.threshold, args.min_ms)
+            or (qo is not None and qn is not None and qn > qo)
+        )
+        failures += bad
+        print(f"{name:<32}{str(o.get('p50_ms')):>10}{str(n.get('p50_ms')):>10}{str(o.get('p99_ms')):>10}"
+              f"{str(n.get('p99_ms')):>10}{str(qo if qo is not None else '-'):>7}{str(qn if qn is not None else '-'):>7}"
+              f"{'  REGRESSION' if bad else ''}")
+    for name in sorted(old["results"].keys() ^ new["results"].keys()):
+        print(f"{name:<32}only in {'old' if name in old['results'] else 'new'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,209 @@
+"""
+현실적인 가짜 장부 생성기 (벤치마크/부하 테스트용)
+==============================================
+실행: python benchmarks/synth.py --users 100 --mean-tx 2000 --years 5 --workdir ./bench-data
+      (workdir에 app.db를 만들고, 같은 폴더에서 uvicorn main:app 을 띄우면 그대로 사용)
+
+- 사용자 N명, 사용자마다 계좌 1~max개 / 지출·수입 카테고리 / 최근 몇 달의 예산
+- 사용자별 거래 수는 **파레토(멱법칙) 분포**: 대부분은 평범하고 소수의 '헤비 유저'가 거래를 몰아서 가짐
+- 카테고리 선택은 Zipf 가중치(식비·교통 같은 몇 개가 대부분), 금액은 로그정규 분포
+- (선택) --subscriptions N: 사용자마다 매달 같은 날·같은 금액의 정기 결제 N개 (정기 결제 탐지용)
+- 거래는 Core executemany로 넣고, 잔액(opening_balance + 합계)/롤업/잔액·누적 예산 체크포인트를 맞춰 둠
+- 모든 사용자의 비밀번호는 같은 값(SYNTH_PASSWORD) — 해시는 한 번만 계산
+"""
+
+import argparse, json, math, os, random, sys, time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List, NamedTuple
+
+from sqlalchemy import func, select
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYNTH_PASSWORD = "benchpass"
+
+EXPENSE_CATEGORIES = ["식비", "교통", "카페", "생활용품", "통신", "주거", "의료", "문화", "쇼핑", "여행", "교육", "경조사"]
+INCOME_CATEGORIES = ["월급", "부수입", "이자", "환급"]
+SUBSCRIPTIONS = [("넷플릭스", 13500), ("유튜브 프리미엄", 14900), ("통신요금", 55000), ("관리비", 180000),
+                 ("헬스장", 70000), ("클라우드 저장소", 2900), ("음악 스트리밍", 10900), ("보험료", 89000)]
+MERCHANTS = ["편의점", "마트", "카페", "지하철", "버스", "택시", "온라인쇼핑", "약국", "식당", "배달", "주유소", "서점",
+             "영화관", "통신사", "관리비", "병원", "헬스장", "넷플릭스", "월급", "이체"]
+
+
+class SynthUser(NamedTuple):
+    id: int
+    username: str
+    tx_count: int
+
+
+class SynthLedger(NamedTuple):
+    users: List[SynthUser]       # 거래 수 내림차순 (users[0]이 가장 무거운 사용자)
+    password: str
+    months: List[str]            # 데이터가 있는 최근 달부터 과거 순 'YYYY-MM'
+    transactions: int
+    seconds: float
+
+
+def load_app(workdir: str):
+    """main.py는 ./app.db를 쓰므로 workdir로 이동한 뒤 import"""
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "0")  # 같은 사용자로 연달아 요청하므로 한도는 끔
+    sys.path.insert(0, ROOT)
+    import main
+    return main
+
+
+def _recent_months(today: date, n: int) -> List[str]:
+    """이번 달부터 과거로 n개월 'YYYY-MM'"""
+    out, d = [], date(today.year, today.month, 1)
+    for _ in range(n):
+        out.append(f"{d.year:04d}-{d.month:02d}")
+        d = (d - timedelta(days=1)).replace(day=1)
+    return out
+
+
+def _zipf_weights(n: int, s: float) -> List[float]:
+    return [1.0 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def generate(
+    main,
+    users: int = 100,
+    mean_tx: int = 2000,
+    years: int = 5,
+    max_accounts: int = 4,
+    expense_categories: int = 8,
+    income_categories: int = 2,
+    budget_months: int = 12,
+    alpha: float = 1.5,
+    zipf_s: float = 1.1,
+    income_ratio: float = 0.08,
+    subscriptions: int = 0,
+    seed: int = 42,
+    chunk: int = 20_000,
+) -> SynthLedger:
+    """main의 엔진/모델로 가짜 장부를 채움 (기존 데이터는 건드리지 않고 추가)"""
+    t0 = time.perf_counter()
+    rnd = random.Random(seed)
+    db = main.SessionLocal()
+    password_hash = main.get_password_hash(SYNTH_PASSWORD)
+    today = date.today()
+    span_days = 365 * years
+    start = today - timedelta(days=span_days)
+    tx_table = main.Transaction.__table__
+
+    # 파레토 분포 평균 = alpha/(alpha-1) → mean_tx가 되도록 스케일, 너무 큰 꼬리는 50배로 자름
+    scale = mean_tx * (alpha - 1) / alpha if alpha > 1 else mean_tx
+    exp_names = EXPENSE_CATEGORIES[:expense_categories]
+    inc_names = INCOME_CATEGORIES[:income_categories]
+    exp_weights = _zipf_weights(len(exp_names), zipf_s)
+    inc_weights = _zipf_weights(len(inc_names), zipf_s)
+
+    created: List[SynthUser] = []
+    total_tx = 0
+    months = _recent_months(today, years * 12)
+    base = db.execute(select(func.count(main.User.id))).scalar() or 0
+    for u in range(users):
+        username = f"synth{base + u:06d}"
+        user = main.User(username=username, email=f"{username}@example.com", password_hash=password_hash, role="user")
+        db.add(user)
+        db.flush()
+
+        accounts = [
+            main.Account(user_id=user.id, account_name=f"계좌{i + 1}", balance=0, opening_balance=0)
+            for i in range(rnd.randint(1, max_accounts))
+        ]
+        exp_cats = [main.Category(user_id=user.id, name=n, type="expense") for n in exp_names]
+        inc_cats = [main.Category(user_id=user.id, name=n, type="income") for n in inc_names]
+        db.add_all(accounts + exp_cats + inc_cats)
+        db.flush()
+
+        n_tx = min(int(scale * rnd.paretovariate(alpha)), mean_tx * 50)
+        acc_weights = _zipf_weights(len(accounts), 1.0)
+        net = {a.id: Decimal(0) for a in accounts}
+        batch = []
+        for _ in range(n_tx):
+            income = rnd.random() < income_ratio
+            cat = rnd.choices(inc_cats, inc_weights)[0] if income else rnd.choices(exp_cats, exp_weights)[0]
+            acc = rnd.choices(accounts, acc_weights)[0]
+            mu = 12.5 if income else 9.5  # 수입 중앙값 ≈ 27만, 지출 ≈ 1.3만
+            amount = Decimal(max(int(math.exp(rnd.gauss(mu, 1.0))), 100))
+            net[acc.id] += amount if income else -amount
+            batch.append({
+                "user_id": user.id,
+                "account_id": acc.id,
+                "category_id": cat.id,
+                "amount": amount,
+                "description": rnd.choice(MERCHANTS) + (f" {rnd.randint(1, 999)}" if rnd.random() < 0.3 else ""),
+                "date": start + timedelta(days=rnd.randrange(span_days)),
+            })
+            if len(batch) >= chunk:
+                db.execute(tx_table.insert(), batch)
+                batch = []
+        for name, amount in rnd.sample(SUBSCRIPTIONS, min(subscriptions, len(SUBSCRIPTIONS))):
+            acc, cat, day = accounts[0], rnd.choice(exp_cats), rnd.randint(1, 28)
+            for month in months:
+                d = date(int(month[:4]), int(month[5:]), day)
+                if start <= d <= today:
+                    net[acc.id] -= amount
+                    n_tx += 1
+                    batch.append({"user_id": user.id, "account_id": acc.id, "category_id": cat.id,
+                                  "amount": Decimal(amount), "description": f"{name} {d.month}월", "date": d})
+        if batch:
+            db.execute(tx_table.insert(), batch)
+
+        for a in accounts:
+            a.opening_balance = Decimal(rnd.randint(0, 5_000_000))
+            a.balance = a.opening_balance + net[a.id]
+
+        for month in months[:budget_months]:
+            for c in exp_cats:
+                db.add(main.Budget(user_id=user.id, category_id=c.id, month=month,
+                                   amount=Decimal(rnd.randint(5, 80) * 10_000)))
+        db.commit()
+        created.append(SynthUser(user.id, username, n_tx))
+        total_tx += n_tx
+
+    main.rebuild_rollups(db)
+    main.rebuild_balance_checkpoints(db)
+    main.rebuild_budget_checkpoints(db)
+    db.close()
+
+    created.sort(key=lambda x: -x.tx_count)
+    return SynthLedger(created, SYNTH_PASSWORD, months, total_tx, round(time.perf_counter() - t0, 2))
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workdir", required=True, help="app.db를 만들 폴더")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--mean-tx", type=int, default=2000, help="사용자당 평균 거래 수")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--alpha", type=float, default=1.5, help="파레토 꼬리 지수 (작을수록 헤비 유저 쏠림)")
+    parser.add_argument("--subscriptions", type=int, default=0, help="사용자별 월 정기 결제 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="요약 대신 사용자/계좌/카테고리 id를 JSON 한 줄로 출력 (부하 스크립트용)")
+    args = parser.parse_args()
+
+    main = load_app(args.workdir)
+    ledger = generate(main, users=args.users, mean_tx=args.mean_tx, years=args.years, alpha=args.alpha,
+                      subscriptions=args.subscriptions, seed=args.seed)
+    if args.json:
+        db = main.SessionLocal()
+        owned = lambda model: {
+            str(u.id): list(db.execute(select(model.id).where(model.user_id == u.id)).scalars()) for u in ledger.users
+        }
+        print(json.dumps({
+            "users": [u._asdict() for u in ledger.users], "password": ledger.password, "months": ledger.months,
+            "transactions": ledger.transactions, "accounts": owned(main.Account), "categories": owned(main.Category),
+        }))
+        db.close()
+        return
+    heavy = ledger.users[0]
+    print(f"{len(ledger.users)} users, {ledger.transactions:,} transactions in {ledger.seconds}s "
+          f"(heaviest: {heavy.username} with {heavy.tx_count:,}, password '{ledger.password}')")
+
+
+if __name__ == "__main__":
+    main_cli()
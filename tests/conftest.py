@@ -0,0 +1,54 @@
+"""
+공용 픽스처 — main.py를 임시 SQLite 파일(WAL)로 한 번만 import
+=============================================================
+- DATABASE_URL / REPORT_JOB_DIR은 import 전에 임시 폴더로 돌림 (작업 폴더의 app.db를 건드리지 않음)
+- 같은 사용자로 연달아 요청하므로 요청 한도는 끔
+- 테스트끼리 DB를 같이 쓰므로 make_user로 매번 새 사용자를 만들어 서로의 데이터와 섞이지 않게 함
+"""
+
+import itertools, os, shutil, sys, tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKDIR = tempfile.mkdtemp(prefix="ledger-tests-")
+DATABASE_URL = f"sqlite:///{os.path.join(WORKDIR, 'app.db')}"
+
+os.environ.update({
+    "LEDGER_ENV": "development",
+    "DATABASE_URL": DATABASE_URL,
+    "REPORT_JOB_DIR": os.path.join(WORKDIR, "report_jobs"),
+    "RATE_LIMIT_ENABLED": "0",
+    "LEDGER_ASYNC_DB": os.environ.get("LEDGER_ASYNC_DB", "0"),
+})
+sys.path.insert(0, ROOT)
+
+_usernames = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def main():
+    import main as app_module
+    yield app_module
+    app_module.engine.dispose()
+    shutil.rmtree(WORKDIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def client(main):
+    from fastapi.testclient import TestClient
+    with TestClient(main.app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def make_user(client):
+    """새 사용자를 만들고 로그인 → Authorization 헤더"""
+    def make(prefix: str = "user") -> dict:
+        username = f"{prefix}{next(_usernames):04d}"
+        password = "pw123456"
+        r = client.post("/auth/register", json={"username": username, "email": f"{username}@example.com", "password": password})
+        assert r.status_code == 200, r.text
+        token = client.post("/auth/login", data={"username": username, "password": password}).json()["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+    return make
@@ -0,0 +1,141 @@
+"""
+동시 쓰기 — 잔액/롤업/체크포인트 갱신이 유실되지 않는지
+=====================================================
+- 테스트 DB에 uvicorn 워커 2개를 띄우고, 같은 사용자의 writer 16개가 계좌 2개 × 카테고리 3개 × 3개월에
+  거래를 만들고(POST) / 금액·계좌·카테고리·날짜를 바꾸고(PATCH) / 지우기(DELETE)를 무작위로 반복합니다.
+  (모든 writer가 같은 롤업 / 잔액 체크포인트 / 누적 예산 체크포인트 행을 두고 부딪힘)
+- 끝나면: verify_rollups가 빈 리스트, 저장된 잔액 = 성공한 요청만으로 계산한 기대 잔액, /reconcile의 drift = 0,
+  체크포인트가 원장에서 다시 만든 값(rebuild_*)과 같아야 합니다. 실패한 요청(5xx/503)은 롤백되므로 기대값에서 제외.
+"""
+
+import asyncio, os, random, socket, subprocess, sys, time
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from conftest import ROOT
+
+WRITERS = 16
+OPS = 20
+MONTHS = ("2025-07", "2025-08", "2025-09")
+OPENING = Decimal("1000.00")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def server(main):
+    """main 픽스처가 스키마를 만든 테스트 DB에 워커 2개 (워커는 DDL을 돌리지 않음)"""
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", ROOT, "--port", str(port),
+         "--workers", "2", "--log-level", "warning"],
+        env=dict(os.environ, LEDGER_AUTO_CREATE_TABLES="0", WEB_CONCURRENCY="2"),
+    )
+    base = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while True:
+        try:
+            if httpx.get(f"{base}/healthz").status_code == 200:
+                break
+        except httpx.HTTPError:
+            pass
+        if time.time() > deadline or proc.poll() is not None:
+            proc.terminate()
+            pytest.fail("uvicorn did not start")
+        time.sleep(0.2)
+    yield base
+    proc.terminate()
+    proc.wait(timeout=30)
+
+
+async def writer(client: httpx.AsyncClient, wid: int, accs: list, cats: dict) -> dict:
+    """이 writer가 성공시킨 변경의 계좌별 잔액 합계(부호 포함)"""
+    rnd = random.Random(wid)
+    mine: dict = {}  # tx_id → (account_id, category type, amount)
+    net = {a: Decimal(0) for a in accs}
+
+    def apply(entry: tuple, sign: int):
+        acc, kind, amount = entry
+        net[acc] += sign * (-amount if kind == "expense" else amount)
+
+    for _ in range(OPS):
+        op = rnd.choice(["create", "create", "patch", "delete"]) if mine else "create"
+        entry = (rnd.choice(accs), rnd.choice(list(cats)), Decimal(rnd.randint(1, 100_000)) / 100)
+        body = {"account_id": entry[0], "category_id": cats[entry[1]][rnd.randrange(len(cats[entry[1]]))],
+                "amount": str(entry[2]), "date": f"{rnd.choice(MONTHS)}-{rnd.randint(1, 28):02d}"}
+        if op == "create":
+            r = await client.post("/transactions", json=body)
+            if r.status_code == 201:
+                mine[r.json()["id"]] = entry
+                apply(entry, 1)
+        elif op == "patch":
+            tx_id = rnd.choice(list(mine))
+            r = await client.patch(f"/transactions/{tx_id}", json=body)
+            if r.status_code == 200:
+                apply(mine[tx_id], -1)
+                apply(entry, 1)
+                mine[tx_id] = entry
+        else:
+            tx_id = rnd.choice(list(mine))
+            r = await client.delete(f"/transactions/{tx_id}")
+            if r.status_code == 204:
+                apply(mine.pop(tx_id), -1)
+        assert r.status_code < 500 or r.status_code == 503, r.text
+    return net
+
+
+async def run_writers(base: str, headers: dict, accs: list, cats: dict) -> dict:
+    async with httpx.AsyncClient(base_url=base, headers=headers, timeout=60) as c:
+        nets = await asyncio.gather(*(writer(c, w, accs, cats) for w in range(WRITERS)))
+    return {a: OPENING + sum(n[a] for n in nets) for a in accs}
+
+
+def test_concurrent_writers_leave_no_drift(main, client, make_user, server):
+    h = make_user("stress")
+    accs = [client.post("/accounts", json={"account_name": f"shared{i}", "balance": str(OPENING)}, headers=h).json()["id"]
+            for i in range(2)]
+    cats = {"expense": [], "income": []}
+    for i, kind in enumerate(["expense", "expense", "income"]):
+        cats[kind].append(client.post("/categories", json={"name": f"{kind}{i}", "type": kind}, headers=h).json()["id"])
+    for month in MONTHS:
+        for cat_id in cats["expense"]:
+            client.post("/budgets", json={"category_id": cat_id, "month": month, "amount": "500"}, headers=h)
+
+    expected = asyncio.run(run_writers(server, h, accs, cats))
+
+    db = main.SessionLocal()
+    try:
+        user_id = db.get(main.Account, accs[0]).user_id
+        assert main.verify_rollups(db, user_id) == []
+        stored = dict(db.execute(select(main.Account.id, main.Account.balance).where(main.Account.id.in_(accs))).all())
+        assert {a: Decimal(stored[a]) for a in accs} == expected
+
+        # 쓰기 경로가 갱신한 체크포인트는 원장에서 다시 만든 값과 (있는 달끼리) 같아야 함
+        checkpoints = [
+            (main.AccountBalanceCheckpoint, main.AccountBalanceCheckpoint.account_id.in_(accs),
+             ("account_id", "month"), ("net_total",), main.rebuild_balance_checkpoints),
+            (main.BudgetCheckpoint, main.BudgetCheckpoint.category_id.in_(cats["expense"] + cats["income"]),
+             ("category_id", "month"), ("cum_budget", "cum_spent"), main.rebuild_budget_checkpoints),
+        ]
+        for model, scope, key, cols, rebuild in checkpoints:
+            def snapshot() -> dict:
+                rows = db.execute(select(*(getattr(model, c) for c in key + cols)).where(scope)).all()
+                return {tuple(r[:len(key)]): tuple(Decimal(v) for v in r[len(key):]) for r in rows}
+            incremental = snapshot()
+            rebuild(db, user_id)
+            rebuilt = snapshot()
+            assert incremental, model.__name__
+            assert {k: v for k, v in incremental.items() if k in rebuilt} == {k: rebuilt[k] for k in incremental if k in rebuilt}
+    finally:
+        db.close()
+
+    for acc_id in accs:
+        rec = client.post(f"/accounts/{acc_id}/reconcile", headers=h).json()
+        assert Decimal(rec["drift"]) == 0, rec
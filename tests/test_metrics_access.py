@@ -0,0 +1,25 @@
+"""
+/metrics와 운영 통계 접근 제어
+============================
+- METRICS_TOKEN이 있으면 `Authorization: Bearer <METRICS_TOKEN>`만 통과 (일반 사용자 토큰은 401)
+- 없으면 개발 모드에서만 열리고 운영 모드에서는 403
+"""
+
+import pytest
+
+OPS_PATHS = ["/metrics", "/db/pool-stats", "/reports/cache-stats", "/auth/cache-stats"]
+
+
+@pytest.mark.parametrize("path", OPS_PATHS)
+def test_ops_endpoints_need_metrics_token(main, client, make_user, monkeypatch, path):
+    monkeypatch.setattr(main, "METRICS_TOKEN", "scrape-secret")
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers=make_user("ops")).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+@pytest.mark.parametrize("path", OPS_PATHS)
+def test_ops_endpoints_closed_in_production_without_token(main, client, make_user, monkeypatch, path):
+    monkeypatch.setattr(main, "METRICS_TOKEN", None)
+    monkeypatch.setattr(main, "PRODUCTION", True)
+    assert client.get(path, headers=make_user("ops")).status_code == 403
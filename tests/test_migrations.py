@@ -0,0 +1,48 @@
+"""
+alembic 마이그레이션 체인 (0001 → head)
+=====================================
+- 빈 SQLite 파일에 `alembic upgrade head` → 모델과 차이가 없는지 `alembic check` → `downgrade base` → 다시 `upgrade head`
+- 예전 DB(0001)에서 개발 모드로 main을 import해도 죽지 않고 migrate 안내만 남기는지, `python main.py migrate`로 head까지 오르는지
+- alembic/env.py가 실제 main.py를 import하므로 별도 프로세스에서 실행 (테스트 세션의 main/DB와 섞이지 않게)
+"""
+
+import os, sqlite3, subprocess, sys
+
+from conftest import ROOT
+
+
+def run(tmp_path, *cmd) -> subprocess.CompletedProcess:
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'migrated.db'}", REPORT_JOB_DIR=str(tmp_path / "jobs"))
+    env.pop("LEDGER_AUTO_CREATE_TABLES", None)
+    return subprocess.run([sys.executable, *cmd], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+
+
+def alembic(tmp_path, *args) -> subprocess.CompletedProcess:
+    return run(tmp_path, "-m", "alembic", "-c", os.path.join(ROOT, "alembic.ini"), *args)
+
+
+def test_upgrade_check_downgrade_upgrade(tmp_path):
+    for args in (("upgrade", "head"), ("check",), ("downgrade", "base"), ("upgrade", "head")):
+        r = alembic(tmp_path, *args)
+        assert r.returncode == 0, f"alembic {' '.join(args)} failed:\n{r.stdout}\n{r.stderr}"
+    assert "No new upgrade operations detected" in alembic(tmp_path, "check").stdout
+
+
+def test_old_stamped_db_is_left_to_migrate(tmp_path):
+    assert alembic(tmp_path, "upgrade", "0001").returncode == 0
+    r = run(tmp_path, "main.py", "migrate")  # import 때 init_db가 0001 스키마에 인덱스를 만들다 죽지 않아야 함
+    assert r.returncode == 0, r.stderr
+    assert "run `python main.py migrate`" in r.stderr
+    assert "No new upgrade operations detected" in alembic(tmp_path, "check").stdout
+
+
+def test_old_unstamped_db_is_not_touched(tmp_path):
+    assert alembic(tmp_path, "upgrade", "0001").returncode == 0
+    with sqlite3.connect(tmp_path / "migrated.db") as conn:  # alembic 이전에 만든 DB처럼
+        conn.execute("DROP TABLE alembic_version")
+    r = run(tmp_path, "-c", "import main")
+    assert r.returncode == 0, r.stderr
+    assert "alembic stamp 0001" in r.stderr and "transactions.user_id" in r.stderr
+    with sqlite3.connect(tmp_path / "migrated.db") as conn:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert "account_balance_checkpoints" not in names and not any(n.startswith("ix_tx_user") for n in names)
@@ -0,0 +1,105 @@
+"""
+목록/집계 쿼리의 실행 계획 (SQLite EXPLAIN QUERY PLAN)
+====================================================
+- 쿼리를 테스트에서 다시 쓰지 않고, 실제 코드 경로(핸들러/집계 함수)가 보낸 SQL을 그대로 잡아 EXPLAIN 합니다.
+  핸들러 쪽 쿼리 모양이 바뀌어 인덱스를 못 타게 되면 여기서 실패합니다.
+- 원장 집계(사용자별 카테고리·월 합계)가 ix_tx_user_date_cat_amount 만으로(covering) 처리되는지
+- GET /transactions(첫 페이지, 커서 다음 페이지)가 ix_tx_user_date_id 를 타고 별도 정렬(TEMP B-TREE)이 없는지
+- 설명 검색(q=)이 목록과 같은 인덱스 순서로 훑으면서 FTS 결과와 대조하는지 (행마다 MATCH를 다시 돌리는 JOIN 계획이 아닌지)
+"""
+
+import random
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@pytest.fixture(scope="module")
+def seeded(main, client):
+    """사용자 하나에 5년치 거래 20,000건 (Core executemany) → (user_id, Authorization 헤더)"""
+    client.post("/auth/register", json={"username": "plans", "email": "plans@example.com", "password": "pw123456"})
+    token = client.post("/auth/login", data={"username": "plans", "password": "pw123456"}).json()["access_token"]
+    rnd = random.Random(42)
+    db = main.SessionLocal()
+    user = db.query(main.User).filter_by(username="plans").one()
+    accounts = [main.Account(user_id=user.id, account_name=f"acc{i}", balance=0) for i in range(3)]
+    cats = [main.Category(user_id=user.id, name=f"exp{i}", type="expense") for i in range(10)]
+    db.add_all(accounts + cats)
+    db.flush()
+    start = date.today() - timedelta(days=365 * 5)
+    db.execute(main.Transaction.__table__.insert(), [{
+        "user_id": user.id, "account_id": rnd.choice(accounts).id, "category_id": rnd.choice(cats).id,
+        "amount": Decimal(rnd.randint(100, 200_000)), "description": rnd.choice(["lunch", "taxi", "coffee", ""]),
+        "date": start + timedelta(days=rnd.randrange(365 * 5)),
+    } for _ in range(20_000)])
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id, {"Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def captured():
+    """블록 안에서 실행된 (SQL, 파라미터) 목록 — 읽기 엔진/비동기 엔진까지 모든 Engine에서"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def transaction_query(statements) -> tuple:
+    """잡힌 문장 중 transactions를 읽는 SELECT 하나"""
+    found = [s for s in statements if s[0].lstrip().upper().startswith("SELECT") and "FROM transactions" in s[0]]
+    assert len(found) == 1, [s[0] for s in statements]
+    return found[0]
+
+
+def plan(main, statement: str, parameters) -> str:
+    with main.engine.connect() as conn:
+        return "\n".join(r[-1] for r in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all())
+
+
+def test_ledger_totals_use_covering_index(main, seeded):
+    user_id, _ = seeded
+    db = main.SessionLocal()
+    try:
+        with captured() as statements:
+            main._ledger_month_totals(db, user_id)
+    finally:
+        db.close()
+    p = plan(main, *transaction_query(statements))
+    assert "USING COVERING INDEX ix_tx_user_date_cat_amount" in p, p
+
+
+def test_transaction_list_keyset_order_has_no_sort(main, client, seeded):
+    _, headers = seeded
+    with captured() as statements:
+        r = client.get("/transactions?limit=50", headers=headers)
+    assert r.status_code == 200 and len(r.json()) == 50
+    p = plan(main, *transaction_query(statements))
+    assert "ix_tx_user_date_id" in p and "TEMP B-TREE" not in p, p
+
+    with captured() as statements:
+        r = client.get("/transactions", params={"limit": 50, "cursor": r.headers["x-next-cursor"]}, headers=headers)
+    assert r.status_code == 200 and len(r.json()) == 50
+    p = plan(main, *transaction_query(statements))
+    assert "ix_tx_user_date_id" in p and "TEMP B-TREE" not in p, p
+
+
+def test_transaction_search_follows_list_index(main, client, seeded):
+    _, headers = seeded
+    with captured() as statements:
+        r = client.get("/transactions", params={"q": "lunch", "limit": 50}, headers=headers)
+    assert r.status_code == 200 and len(r.json()) == 50
+    p = plan(main, *transaction_query(statements))
+    assert "ix_tx_user_date_id" in p and "LIST SUBQUERY" in p and "TEMP B-TREE" not in p, p
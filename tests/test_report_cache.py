@@ -0,0 +1,52 @@
+"""
+리포트 응답 캐시 — 무효화가 빠지는 경로가 없는지
+==============================================
+- 롤업 재계산(`python main.py rollup rebuild` = rebuild_rollups) 뒤에는 복구 전 ETag로 304가 나오면 안 됨
+- memory 백엔드의 버전 카운터는 개수 상한이 있고, 밀려난 카운터가 예전 버전(= 옛 ETag)으로 돌아가면 안 됨
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import update
+
+
+@pytest.mark.parametrize("scope", ["user", "all"])
+def test_rebuild_rollups_invalidates_cached_reports(main, client, make_user, scope):
+    h = make_user("cache")
+    acc = client.post("/accounts", json={"account_name": "a", "balance": "0"}, headers=h).json()["id"]
+    cat = client.post("/categories", json={"name": "food", "type": "expense"}, headers=h).json()["id"]
+    client.post("/transactions", json={"account_id": acc, "category_id": cat, "amount": "1000", "date": "2025-09-01"}, headers=h)
+
+    db = main.SessionLocal()
+    try:
+        user_id = db.get(main.Account, acc).user_id
+        # 롤업이 원장과 어긋난 상태(복구가 필요한 상황)를 만들고 그 값으로 캐시
+        db.execute(update(main.MonthlyCategoryTotal).where(main.MonthlyCategoryTotal.user_id == user_id).values(total=1))
+        db.commit()
+        stale = client.get("/reports/summary?month=2025-09", headers=h)
+        assert Decimal(stale.json()["total_expense"]) == 1
+
+        main.rebuild_rollups(db, user_id if scope == "user" else None)
+    finally:
+        db.close()
+
+    r = client.get("/reports/summary?month=2025-09", headers={**h, "If-None-Match": stale.headers["etag"]})
+    assert r.status_code == 200
+    assert r.headers["etag"] != stale.headers["etag"]
+    assert Decimal(r.json()["total_expense"]) == 1000
+
+
+def test_evicted_version_counter_never_repeats(main):
+    backend = main.InMemoryCacheBackend(max_counters=4)
+    cache = main.ReportCache(backend)
+    seen = {cache.version(1, "2025-09")[0]}
+    for _ in range(3):
+        cache.bump(1, "2025-09")
+        seen.add(cache.version(1, "2025-09")[0])
+    for user_id in range(2, 10):  # 다른 사용자들의 쓰기로 1번 사용자의 카운터가 밀려남
+        cache.bump(user_id, "2025-09")
+    assert len(backend._meta) <= 4
+    assert cache.version(1, "2025-09")[0] not in seen
+    cache.bump(1, "2025-09")
+    assert cache.version(1, "2025-09")[0] not in seen
@@ -0,0 +1,65 @@
+"""
+운영 모드 기동 — `python main.py serve --workers 2`
+================================================
+- LEDGER_ENV=production + 임시 SQLite 파일로 실제 런처를 띄움: 부모가 alembic upgrade head → gunicorn(없으면 uvicorn) 워커 2개
+- /healthz, /readyz가 200이고, 가입 → 로그인 → 계좌 생성이 마이그레이션된 스키마에서 돌아가는지
+"""
+
+import os, secrets, signal, socket, subprocess, sys, time
+
+import httpx
+import pytest
+
+from conftest import ROOT
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def served(tmp_path):
+    port = free_port()
+    env = dict(
+        os.environ, LEDGER_ENV="production", SECRET_KEY=secrets.token_urlsafe(32),
+        DATABASE_URL=f"sqlite:///{tmp_path / 'app.db'}", REPORT_JOB_DIR=str(tmp_path / "jobs"),
+    )
+    env.pop("LEDGER_AUTO_CREATE_TABLES", None)
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "main.py"), "serve", "--workers", "2", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=tmp_path, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    base = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 90
+    while True:
+        try:
+            if httpx.get(f"{base}/healthz").status_code == 200:
+                break
+        except httpx.HTTPError:
+            pass
+        if time.time() > deadline or proc.poll() is not None:
+            proc.kill()
+            pytest.fail("main.py serve did not start:\n" + proc.communicate()[0])
+        time.sleep(0.3)
+    yield base
+    proc.send_signal(signal.SIGTERM)
+    try:
+        proc.communicate(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+
+
+def test_serve_starts_migrated_workers(served):
+    with httpx.Client(base_url=served, timeout=30) as c:
+        assert c.get("/readyz").status_code == 200
+        r = c.post("/auth/register", json={"username": "served", "email": "served@example.com", "password": "pw123456"})
+        assert r.status_code == 200, r.text
+        r = c.post("/auth/login", data={"username": "served", "password": "pw123456"})
+        assert r.status_code == 200, r.text
+        c.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        r = c.post("/accounts", json={"account_name": "main", "balance": "0"})
+        assert r.status_code == 201, r.text
+        assert c.get("/accounts").json()[0]["account_name"] == "main"
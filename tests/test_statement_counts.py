@@ -0,0 +1,50 @@
+"""
+거래 수정/삭제 경로의 요청당 SQL 문 수
+====================================
+- 응답 헤더 X-Query-Count(요청 하나 동안 실행된 SQL 문 수)를 기대값과 비교합니다.
+- 거래/계좌/카테고리는 JOIN 한 번으로 불러와야 하며, tx.account / tx.category 지연 로딩이
+  다시 생기거나 쓰기 경로에 문장이 늘면 숫자가 달라져 실패합니다. 의도한 변경이면 기대값과 내역을 함께 고치세요.
+"""
+
+import pytest
+
+# (설명, 메서드, body) → 기대 SQL 문 수
+#   PATCH: 거래+계좌+카테고리 1 / 롤업 upsert 1 / 거래 UPDATE 1 / 계좌 UPDATE 1
+#          / 잔액 체크포인트 upsert 1 + UPDATE 1 / 누적 예산 체크포인트 upsert 1 + UPDATE 1 / commit 후 refresh 1
+#   이동 PATCH: 위 + 새 계좌·카테고리 확인 1 (롤업/체크포인트는 키가 늘어도 executemany 한 번씩)
+#   DELETE: 거래+계좌+카테고리 1 / 롤업 upsert 1 / 계좌 UPDATE 1 / 잔액 체크포인트 2 / 누적 예산 체크포인트 2 / 거래 DELETE 1
+#   (거래 수가 0이 된 롤업 행이 생기면 그 요청만 DELETE 1 추가 — 아래 경우는 같은 달 거래가 남아 있어 해당 없음)
+CASES = [
+    ("patch amount", "PATCH", {"amount": "1500"}, 9),
+    ("patch to same account/category", "PATCH", {"account_id": "acc", "category_id": "cat", "amount": "1200"}, 9),
+    ("patch moving account+category", "PATCH", {"account_id": "acc2", "category_id": "cat2"}, 10),
+    ("delete", "DELETE", None, 8),
+]
+
+
+@pytest.fixture(scope="module")
+def ledger(client, make_user):
+    h = make_user("stmt")
+    ids = {
+        "acc": client.post("/accounts", json={"account_name": "a", "balance": "0"}, headers=h).json()["id"],
+        "acc2": client.post("/accounts", json={"account_name": "b", "balance": "0"}, headers=h).json()["id"],
+        "cat": client.post("/categories", json={"name": "food", "type": "expense"}, headers=h).json()["id"],
+        "cat2": client.post("/categories", json={"name": "pay", "type": "income"}, headers=h).json()["id"],
+    }
+    # 롤업/체크포인트 행이 이미 있는 평소 상태에서 측정 (첫 거래가 행을 만드는 비용은 빼고)
+    client.post("/transactions", json={"account_id": ids["acc"], "category_id": ids["cat"], "amount": "1", "date": "2025-09-01"}, headers=h)
+    client.post("/transactions", json={"account_id": ids["acc2"], "category_id": ids["cat2"], "amount": "1", "date": "2025-09-01"}, headers=h)
+    return h, ids
+
+
+@pytest.mark.parametrize("name,method,body,expected", CASES, ids=[c[0] for c in CASES])
+def test_write_statement_count(client, ledger, name, method, body, expected):
+    h, ids = ledger
+    tx = client.post("/transactions", json={
+        "account_id": ids["acc"], "category_id": ids["cat"], "amount": "1000", "date": "2025-09-01",
+    }, headers=h).json()["id"]
+    if body is not None:
+        body = {k: ids.get(v, v) for k, v in body.items()}
+    r = client.request(method, f"/transactions/{tx}", json=body, headers=h)
+    assert r.status_code < 300, r.text
+    assert int(r.headers["x-query-count"]) == expected
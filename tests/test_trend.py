@@ -0,0 +1,42 @@
+"""
+/reports/trend — 구간별 금액 형식
+===============================
+- 거래가 없는 구간도 금액은 "0.00" (소수 둘째 자리까지), 이동평균/증감도 같은 형식
+- 구간 라벨/일수 SQL은 쿼리를 실행할 세션의 방언을 따름 (읽기 DB가 쓰기 DB와 다른 종류일 수 있음)
+"""
+
+import re
+from datetime import date
+
+from sqlalchemy import create_mock_engine
+from sqlalchemy.orm import Session
+
+MONEY = re.compile(r"^-?\d+\.\d{2}$")
+
+
+def test_trend_money_always_has_two_decimals(client, make_user):
+    h = make_user("trend")
+    acc = client.post("/accounts", json={"account_name": "a", "balance": "0"}, headers=h).json()["id"]
+    cat = client.post("/categories", json={"name": "food", "type": "expense"}, headers=h).json()["id"]
+    for amount, day in (("1000", "2025-08-03"), ("10.5", "2025-08-04")):
+        client.post("/transactions", json={"account_id": acc, "category_id": cat, "amount": amount, "date": day}, headers=h)
+
+    r = client.get("/reports/trend?from=2025-07&to=2025-09&ma=2&delta=true", headers=h)
+    assert r.status_code == 200, r.text
+    points = r.json()["points"]
+    assert [p["expense"] for p in points] == ["0.00", "1010.50", "0.00"]
+    for p in points:
+        for key in ("income", "expense", "net", "income_ma", "expense_ma", "net_ma", "income_delta", "expense_delta", "net_delta"):
+            assert p[key] is None or MONEY.match(p[key]), (p["period"], key, p[key])
+
+
+def test_sql_helpers_follow_session_dialect(main):
+    pg = create_mock_engine("postgresql://", lambda *args, **kwargs: None)  # DATABASE_URL은 SQLite 그대로
+    db = Session(bind=pg)
+
+    def sql(expr) -> str:
+        return str(expr.compile(dialect=pg.dialect))
+
+    assert "date_trunc" in sql(main._sql_bucket(db, main.Transaction.date, "week"))
+    assert "to_char" in sql(main._sql_month(db, main.Transaction.date))
+    assert "julianday" not in sql(main._sql_days_since(db, main.Transaction.date, date(2025, 1, 1)))